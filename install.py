@@ -12,121 +12,465 @@ import platform
 import subprocess
 import json
 import shutil
+import hashlib
+import functools
 from pathlib import Path
 import re
-from typing import List, Optional, Dict, Any
+import shlex
+import locale
+import queue
+import signal
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Dict, Any, Callable, Tuple
+
+try:
+    # Optional: faster JSON encoding for settings.json when available
+    import orjson
+except ImportError:
+    orjson = None
 
 # Version and configuration
 INSTALLER_VERSION = "0.4.0"
 INSTALL_BRANCH = "main"
 REPO_URL = "https://github.com/ericbuess/claude-code-docs.git"
 
+# platform.system() is resolved once per process
+_SYSTEM = platform.system().lower()
+
+# Git path cache written inside the install directory's .git folder
+GIT_PATH_CACHE_NAME = "claude-docs-git-path.json"
+
+# Manifest file that is updated automatically and ignored by the change checks
+MANIFEST_PATH = "docs/docs_manifest.json"
+
+# Install metadata in the Claude directory, read by the uninstaller
+STATE_FILE_NAME = "claude-code-docs.state.json"
+
+# Printed by batched shell scripts once every required step has succeeded
+_SCRIPT_OK = "__CLAUDE_DOCS_OK__"
+
+def _has_float(value: Any) -> bool:
+    """Check a decoded JSON value for floats anywhere inside it"""
+    if isinstance(value, float):
+        return True
+    if isinstance(value, dict):
+        return any(_has_float(item) for item in value.values())
+    if isinstance(value, list):
+        return any(_has_float(item) for item in value)
+    return False
+
+def _encode_settings(settings_data: Dict[str, Any]) -> bytes:
+    """Encode settings as 2-space indented UTF-8 JSON
+    
+    orjson writes NaN/Infinity as null and formats some floats differently
+    (1e16 vs 1e+16), so settings containing floats go through the stdlib.
+    """
+    if orjson is not None and not _has_float(settings_data):
+        try:
+            return orjson.dumps(settings_data, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            pass  # e.g. integers orjson cannot represent - use the stdlib encoder
+    return json.dumps(settings_data, indent=2, ensure_ascii=False).encode("utf-8")
+
+def _log(*lines: str):
+    """Print several lines with a single write (one flush on a console)"""
+    print("\n".join(lines))
+
+# Patterns used to find installation paths in existing Claude config files
+_DOCS_LINE_RE = re.compile(r'^.*(?:claude-code-docs|LOCAL DOCS AT: ).*$', re.MULTILINE)
+_UNQUOTED_RE = re.compile(r'[^ "]*claude-code-docs[^ "]*')
+_QUOTED_RE = re.compile(r'"(?P<p>[^"]*claude-code-docs[^"]*)"')
+_DIR_RE = re.compile(r'(.*/claude-code-docs)(/.*)?$')
+
+# /docs command file contents; only the helper path is filled in at install time
+_WINDOWS_COMMAND_TEMPLATE = '''Execute the Claude Code Docs helper script using Python
+
+Usage:
+- /docs - List all available documentation topics
+- /docs <topic> - Read specific documentation with link to official docs
+- /docs -t - Check sync status without reading a doc
+- /docs -t <topic> - Check freshness then read documentation
+- /docs whats new - Show recent documentation changes (or "what's new")
+
+Examples of expected output:
+
+When reading a doc:
+📚 COMMUNITY MIRROR: https://github.com/ericbuess/claude-code-docs
+📖 OFFICIAL DOCS: https://docs.anthropic.com/en/docs/claude-code
+
+[Doc content here...]
+
+📖 Official page: https://docs.anthropic.com/en/docs/claude-code/hooks
+
+When showing what's new:
+📚 Recent documentation updates:
+
+• 5 hours ago:
+  📎 https://github.com/ericbuess/claude-code-docs/commit/eacd8e1
+  📄 data-usage: https://docs.anthropic.com/en/docs/claude-code/data-usage
+     ➕ Added: Privacy safeguards
+  📄 security: https://docs.anthropic.com/en/docs/claude-code/security
+     ✨ Data flow and dependencies section moved here
+
+📎 Full changelog: https://github.com/ericbuess/claude-code-docs/commits/main/docs
+📚 COMMUNITY MIRROR - NOT AFFILIATED WITH ANTHROPIC
+
+Every request checks for the latest documentation from GitHub (takes ~0.4s).
+The helper script handles all functionality including auto-updates.
+
+Execute: python "{helper}" $ARGUMENTS
+'''
+
+_UNIX_COMMAND_TEMPLATE = '''Execute the Claude Code Docs helper script at {helper}
+
+Usage:
+- /docs - List all available documentation topics
+- /docs <topic> - Read specific documentation with link to official docs
+- /docs -t - Check sync status without reading a doc
+- /docs -t <topic> - Check freshness then read documentation
+- /docs whats new - Show recent documentation changes (or "what's new")
+
+Examples of expected output:
+
+When reading a doc:
+📚 COMMUNITY MIRROR: https://github.com/ericbuess/claude-code-docs
+📖 OFFICIAL DOCS: https://docs.anthropic.com/en/docs/claude-code
+
+[Doc content here...]
+
+📖 Official page: https://docs.anthropic.com/en/docs/claude-code/hooks
+
+When showing what's new:
+📚 Recent documentation updates:
+
+• 5 hours ago:
+  📎 https://github.com/ericbuess/claude-code-docs/commit/eacd8e1
+  📄 data-usage: https://docs.anthropic.com/en/docs/claude-code/data-usage
+     ➕ Added: Privacy safeguards
+  📄 security: https://docs.anthropic.com/en/docs/claude-code/security
+     ✨ Data flow and dependencies section moved here
+
+📎 Full changelog: https://github.com/ericbuess/claude-code-docs/commits/main/docs
+📚 COMMUNITY MIRROR - NOT AFFILIATED WITH ANTHROPIC
+
+Every request checks for the latest documentation from GitHub (takes ~0.4s).
+The helper script handles all functionality including auto-updates.
+
+Execute: {helper} "$ARGUMENTS"
+'''
+
+class GitSession:
+    """Long-lived shell that runs read-only git queries for one repository
+    
+    Commands are written to the shell's stdin and their output is read back
+    up to a sentinel line, so repeated queries pay for one shell spawn instead
+    of one process launch per query. Falls back to one-shot subprocess calls
+    when no suitable shell is available.
+    """
+    
+    _END = "__CLAUDE_DOCS_GIT_END__"
+    _LOOP = (r'while IFS= read -r cmd; do '
+             r'eval "\"\$CLAUDE_DOCS_GIT\" $cmd" </dev/null; '
+             r'printf "\n%s %d\n" "$CLAUDE_DOCS_GIT_END" $?; '
+             r'done')
+    
+    def __init__(self, git_exe: str, cwd: Path, os_type: str):
+        self.git_exe = git_exe
+        self.cwd = cwd
+        self.os_type = os_type
+        self._proc = None
+        self._lines = None
+        self._reader = None
+    
+    def _find_shell(self) -> Optional[str]:
+        """Find a POSIX shell to host the session"""
+        if self.os_type == "windows":
+            # Only trust the bash bundled with Git for Windows (bash.exe on
+            # PATH may be the WSL launcher, which cannot run Windows git)
+            git_root = Path(self.git_exe).parent.parent
+            bash = git_root / "bin" / "bash.exe"
+            return str(bash) if bash.exists() else None
+        return "/bin/sh" if Path("/bin/sh").exists() else None
+    
+    def start(self) -> "GitSession":
+        """Spawn the shell (no-op if no shell is available)"""
+        shell = self._find_shell()
+        if shell:
+            env = dict(os.environ)
+            env["CLAUDE_DOCS_GIT"] = self.git_exe.replace('\\', '/')
+            env["CLAUDE_DOCS_GIT_END"] = self._END
+            try:
+                self._proc = subprocess.Popen(
+                    [shell, "-c", self._LOOP],
+                    cwd=self.cwd,
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                    env=env,
+                    # Own process group, so a timeout can kill git along with the shell
+                    start_new_session=(os.name != "nt")
+                )
+            except OSError:
+                self._proc = None
+            else:
+                # stdout is read on a thread so that waits for output can time out
+                self._lines = queue.Queue()
+                self._reader = threading.Thread(
+                    target=self._read_stdout, args=(self._proc.stdout, self._lines), daemon=True
+                )
+                self._reader.start()
+        return self
+    
+    @staticmethod
+    def _read_stdout(stdout, lines: "queue.Queue[bytes]"):
+        """Forward the shell's output line by line (b"" marks end of output)"""
+        for line in iter(stdout.readline, b""):
+            lines.put(line)
+        lines.put(b"")
+    
+    def _kill(self, proc: subprocess.Popen):
+        """Kill the shell and any git command it is running"""
+        try:
+            if os.name != "nt":
+                os.killpg(proc.pid, signal.SIGKILL)
+            else:
+                proc.kill()
+        except OSError:
+            pass  # Already gone
+    
+    def close(self, kill: bool = False):
+        """Shut down the shell (immediately if kill is set)"""
+        if self._proc is None:
+            return
+        proc, self._proc = self._proc, None
+        reader, self._reader = self._reader, None
+        try:
+            if kill:
+                self._kill(proc)
+            proc.stdin.close()
+            proc.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            self._kill(proc)
+            proc.wait()
+        finally:
+            # The reader sees EOF once the shell and its children are gone
+            reader.join(timeout=1)
+            if not reader.is_alive():
+                proc.stdout.close()
+    
+    def run(self, args: List[str], timeout: int = 30,
+            text: bool = True) -> subprocess.CompletedProcess:
+        """Run a read-only git command, returning its stdout as text (or bytes)"""
+        return self.run_many([args], timeout=timeout, text=text)[0]
+    
+    def run_many(self, commands: List[List[str]], timeout: int = 30,
+                 text: bool = True) -> List[subprocess.CompletedProcess]:
+        """Run several read-only git commands in one round-trip to the shell
+        
+        Each command gets `timeout` seconds, as with the one-shot calls.
+        """
+        if self._proc is not None:
+            try:
+                for args in commands:
+                    self._send(args)
+                return [self._receive(args, timeout, text) for args in commands]
+            except subprocess.TimeoutExpired as e:
+                # A hung command (e.g. waiting on a lock) - drop the session rather than retry
+                self.close(kill=True)
+                raise RuntimeError(f"Git command timed out: {' '.join(e.cmd)}")
+            except (OSError, ValueError, RuntimeError):
+                # Shell went away - stop using it and fall back below
+                self.close()
+        
+        results = []
+        for args in commands:
+            try:
+                results.append(subprocess.run(
+                    [self.git_exe] + args,
+                    cwd=self.cwd,
+                    capture_output=True,
+                    text=text,
+                    timeout=timeout
+                ))
+            except subprocess.TimeoutExpired:
+                raise RuntimeError(f"Git command timed out: {' '.join([self.git_exe] + args)}")
+        return results
+    
+    def _send(self, args: List[str]):
+        """Write one command to the shell"""
+        command = " ".join(shlex.quote(arg) for arg in args) + "\n"
+        self._proc.stdin.write(command.encode("utf-8"))
+        self._proc.stdin.flush()
+    
+    def _receive(self, args: List[str], timeout: float,
+                 text: bool = True) -> subprocess.CompletedProcess:
+        """Read the output of the next command up to its sentinel
+        
+        Raises subprocess.TimeoutExpired if the command runs longer than timeout.
+        """
+        end_marker = self._END.encode("ascii") + b" "
+        deadline = time.monotonic() + timeout
+        chunks = []
+        while True:
+            try:
+                line = self._lines.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                raise subprocess.TimeoutExpired([self.git_exe] + args, timeout)
+            if not line:
+                raise RuntimeError("Git session terminated unexpectedly")
+            if line.startswith(end_marker):
+                returncode = int(line[len(end_marker):])
+                break
+            chunks.append(line)
+        
+        # Drop the newline printed ahead of the sentinel
+        stdout = b"".join(chunks)[:-1]
+        if not text:
+            return subprocess.CompletedProcess([self.git_exe] + args, returncode, stdout, b"")
+        encoding = locale.getpreferredencoding(False)
+        return subprocess.CompletedProcess(
+            [self.git_exe] + args, returncode, stdout.decode(encoding, errors="replace"), ""
+        )
+
+
 class CrossPlatformInstaller:
-    def __init__(self):
+    def __init__(self, assume_yes: bool = False):
         self.os_type = self._detect_os()
-        self.install_dir = self._get_install_dir()
-        self.claude_dir = self._get_claude_dir()
-        self.old_installations = []
+        # Skip the discard-local-changes prompt (--yes or CLAUDE_DOCS_ASSUME_YES=1)
+        self.assume_yes = assume_yes or os.environ.get("CLAUDE_DOCS_ASSUME_YES") == "1"
+        home = self._compute_home()
+        self._home_str = str(home)  # for ~ expansion of paths found in config files
+        self.install_dir = home / ".claude-code-docs"
+        self.claude_dir = home / ".claude"
+        # String form for git arguments and generated scripts/commands
+        self._install_dir_str = os.fspath(self.install_dir)
+        self._old_installations = None  # found lazily, see old_installations
         self.git_executable = None
+        self._git_status_cache = {}
+        self._git_session = None
+        self._background_checks = None
+        self._background_messages = []
         
         # Print OS detection info (use ASCII for Windows compatibility)
         print(f"[+] Detected {self.os_type.title()}")
         print(f"[+] Install directory: {self.install_dir}")
         print(f"[+] Claude directory: {self.claude_dir}")
         
+    @property
+    def old_installations(self) -> List[Path]:
+        """Existing installations at other locations (scanned on first use)"""
+        if self._old_installations is None:
+            self._old_installations = self.find_existing_installations()
+        return self._old_installations
+    
+    @old_installations.setter
+    def old_installations(self, value: List[Path]):
+        self._old_installations = value
+    
     def _detect_os(self) -> str:
         """Detect operating system type"""
-        system = platform.system().lower()
-        if system == "windows":
+        if _SYSTEM == "windows":
             return "windows"
-        elif system == "darwin":
+        elif _SYSTEM == "darwin":
             return "macos"
-        elif system == "linux":
+        elif _SYSTEM == "linux":
             return "linux"
         else:
             # Default to linux for other unix-like systems
             return "linux"
     
-    def _get_install_dir(self) -> Path:
-        """Get the installation directory for this platform"""
+    def _compute_home(self) -> Path:
+        """Get the user's home directory for this platform"""
         if self.os_type == "windows":
-            # Use USERPROFILE on Windows instead of ~
-            user_profile = os.environ.get("USERPROFILE")
-            if user_profile:
-                return Path(user_profile) / ".claude-code-docs"
-            else:
-                # Fallback to HOME if USERPROFILE is not set
-                home = os.environ.get("HOME")
-                if home:
-                    return Path(home) / ".claude-code-docs"
-                else:
-                    raise RuntimeError("Could not determine user home directory on Windows")
-        else:
-            # macOS and Linux use ~ which expands to HOME
-            home = os.environ.get("HOME")
-            if home:
-                return Path(home) / ".claude-code-docs"
-            else:
-                # Fallback using Path.home() for cross-platform compatibility
-                return Path.home() / ".claude-code-docs"
+            # Use USERPROFILE on Windows instead of ~, falling back to HOME
+            home = os.environ.get("USERPROFILE") or os.environ.get("HOME")
+            if not home:
+                raise RuntimeError("Could not determine user home directory on Windows")
+            return Path(home)
+        
+        # macOS and Linux use ~ which expands to HOME
+        home = os.environ.get("HOME")
+        if home:
+            return Path(home)
+        # Fallback using Path.home() for cross-platform compatibility
+        return Path.home()
     
-    def _get_claude_dir(self) -> Path:
-        """Get Claude configuration directory for this platform"""
-        if self.os_type == "windows":
-            # Use USERPROFILE on Windows instead of ~
-            user_profile = os.environ.get("USERPROFILE")
-            if user_profile:
-                return Path(user_profile) / ".claude"
-            else:
-                # Fallback to HOME if USERPROFILE is not set
-                home = os.environ.get("HOME")
-                if home:
-                    return Path(home) / ".claude"
-                else:
-                    raise RuntimeError("Could not determine user home directory on Windows")
-        else:
-            # macOS and Linux use ~ which expands to HOME
-            home = os.environ.get("HOME")
-            if home:
-                return Path(home) / ".claude"
-            else:
-                # Fallback using Path.home() for cross-platform compatibility
-                return Path.home() / ".claude"
+    def _git_path_cache_file(self) -> Path:
+        """Location of the git path cache (inside .git so it never shows up in status)"""
+        return self.install_dir / ".git" / GIT_PATH_CACHE_NAME
+    
+    def _path_hash(self) -> str:
+        """Hash of PATH, used to invalidate the git path cache"""
+        return hashlib.blake2b(os.fsencode(os.environ.get("PATH", ""))).hexdigest()
+    
+    def _load_cached_git_executable(self) -> Optional[str]:
+        """Return the git path resolved by a previous run if PATH is unchanged"""
+        try:
+            with open(self._git_path_cache_file(), 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return None
+        
+        if not isinstance(cached, dict) or cached.get("path_hash") != self._path_hash():
+            return None
+        
+        # A stat is enough here - the path was verified when it was cached
+        git_path = cached.get("git")
+        if isinstance(git_path, str) and Path(git_path).exists():
+            return git_path
+        return None
+    
+    def _save_cached_git_executable(self, git_path: str):
+        """Persist the resolved git path for subsequent installer runs"""
+        cache_file = self._git_path_cache_file()
+        if not cache_file.parent.is_dir():
+            # Not cloned yet - _fresh_clone saves it once the repo exists
+            return
+        try:
+            with open(cache_file, 'w', encoding='utf-8') as f:
+                json.dump({"git": git_path, "path_hash": self._path_hash()}, f)
+        except OSError:
+            pass  # Cache is an optimization only
+    
+    def _remember_git_executable(self, git_path: str) -> str:
+        """Record a verified git path in memory and on disk"""
+        self.git_executable = git_path
+        self._save_cached_git_executable(git_path)
+        return git_path
     
     def _find_git_executable(self) -> Optional[str]:
         """Find git executable path across platforms"""
         if self.git_executable:
             return self.git_executable
+        
+        # Reuse the path found by a previous run (skips the lookup subprocesses)
+        cached_path = self._load_cached_git_executable()
+        if cached_path:
+            self.git_executable = cached_path
+            return cached_path
             
         # Common git executable names
         git_names = ["git"]
         if self.os_type == "windows":
             git_names.extend(["git.exe", "git.cmd"])
         
-        # Try to find git in PATH
+        # Try to find git in PATH (in-process lookup, no where/which subprocess)
         for git_name in git_names:
+            git_path = shutil.which(git_name)
+            if not git_path:
+                continue
+            # Verify it works
             try:
-                result = subprocess.run(
-                    ["where" if self.os_type == "windows" else "which", git_name],
+                test_result = subprocess.run(
+                    [git_path, "--version"],
                     capture_output=True,
                     text=True,
                     timeout=10
                 )
-                if result.returncode == 0 and result.stdout.strip():
-                    git_path = result.stdout.strip().split('\n')[0]  # Take first result
-                    # Verify it works
-                    try:
-                        test_result = subprocess.run(
-                            [git_path, "--version"],
-                            capture_output=True,
-                            text=True,
-                            timeout=10
-                        )
-                        if test_result.returncode == 0:
-                            self.git_executable = git_path
-                            return git_path
-                    except (subprocess.TimeoutExpired, OSError):
-                        continue
+                if test_result.returncode == 0:
+                    return self._remember_git_executable(git_path)
             except (subprocess.TimeoutExpired, OSError):
                 continue
         
@@ -149,8 +493,7 @@ class CrossPlatformInstaller:
                             timeout=10
                         )
                         if test_result.returncode == 0:
-                            self.git_executable = path
-                            return path
+                            return self._remember_git_executable(path)
                     except (subprocess.TimeoutExpired, OSError):
                         continue
         
@@ -158,8 +501,14 @@ class CrossPlatformInstaller:
     
     def _run_git_command(self, args: List[str], cwd: Optional[Path] = None, 
                         capture_output: bool = True, timeout: int = 30,
-                        check: bool = False) -> subprocess.CompletedProcess:
-        """Run a git command with proper error handling"""
+                        check: bool = False, text: bool = True,
+                        stdout: Optional[int] = None,
+                        stderr: Optional[int] = None) -> subprocess.CompletedProcess:
+        """Run a git command with proper error handling
+        
+        Passing stdout/stderr (e.g. subprocess.DEVNULL) overrides capture_output
+        for commands whose output is discarded anyway.
+        """
         git_exe = self._find_git_executable()
         if not git_exe:
             raise RuntimeError("Git executable not found")
@@ -169,8 +518,10 @@ class CrossPlatformInstaller:
             return subprocess.run(
                 cmd,
                 cwd=cwd,
-                capture_output=capture_output,
-                text=True,
+                capture_output=capture_output and stdout is None and stderr is None,
+                stdout=stdout,
+                stderr=stderr,
+                text=text,
                 timeout=timeout,
                 check=check
             )
@@ -181,146 +532,231 @@ class CrossPlatformInstaller:
                 raise RuntimeError(f"Git command failed: {' '.join(cmd)}\nError: {e.stderr}")
             return e
     
-    def _git_get_current_branch(self, repo_dir: Path) -> str:
-        """Get current git branch"""
-        try:
-            result = self._run_git_command(
-                ["rev-parse", "--abbrev-ref", "HEAD"],
-                cwd=repo_dir
-            )
-            if result.returncode == 0:
-                return result.stdout.strip()
-            else:
-                return "unknown"
-        except Exception:
-            return "unknown"
+    def _git_query(self, args: List[str], cwd: Path,
+                   text: bool = True) -> subprocess.CompletedProcess:
+        """Run a read-only git command, reusing the open GitSession for cwd if any"""
+        return self._git_query_many([args], cwd=cwd, text=text)[0]
     
-    def _git_has_uncommitted_changes(self, repo_dir: Path, exclude_manifest: bool = True) -> bool:
-        """Check if repository has uncommitted changes"""
+    def _git_query_many(self, commands: List[List[str]], cwd: Path,
+                        text: bool = True) -> List[subprocess.CompletedProcess]:
+        """Run several read-only git commands, batched through the open GitSession if any"""
+        if self._git_session is not None and self._git_session.cwd == cwd:
+            return self._git_session.run_many(commands, text=text)
+        return [self._run_git_command(args, cwd=cwd, text=text) for args in commands]
+    
+    def _git_status_porcelain(self, repo_dir: Path) -> List[Tuple[str, str]]:
+        """Get `git status --porcelain` entries for a repository as (code, path) pairs
+        
+        Runs status once with -z and memoizes the parsed entries on the repo
+        path and the mtime of .git/index, so the conflict, local-change and
+        untracked checks share a single git invocation. The output is read as
+        raw bytes: -z entries are NUL-terminated and paths are never quoted.
+        """
+        cache_key = self._git_status_cache_key(repo_dir)
+        if cache_key is not None and cache_key in self._git_status_cache:
+            return self._git_status_cache[cache_key]
+        
         try:
-            result = self._run_git_command(
-                ["status", "--porcelain"],
-                cwd=repo_dir
-            )
+            result = self._git_query(["status", "--porcelain", "-z"], cwd=repo_dir, text=False)
             if result.returncode != 0:
-                return False
-            
-            changes = result.stdout.strip()
-            if not changes:
-                return False
-            
-            if exclude_manifest:
-                # Filter out docs_manifest.json changes
-                filtered_changes = []
-                for line in changes.split('\n'):
-                    if line.strip() and "docs/docs_manifest.json" not in line:
-                        filtered_changes.append(line)
-                return len(filtered_changes) > 0
-            
-            return True
+                return []
         except Exception:
-            return False
+            return []
+        
+        entries = self._parse_git_status_z(result.stdout)
+        if cache_key is not None:
+            self._git_status_cache[cache_key] = entries
+        return entries
     
-    def _git_has_conflicts(self, repo_dir: Path, exclude_manifest: bool = True) -> bool:
-        """Check if repository has merge conflicts"""
+    def _git_status_cache_key(self, repo_dir: Path) -> Optional[Tuple[str, int]]:
+        """Status cache key: the repo path and the mtime of its .git/index"""
         try:
-            result = self._run_git_command(
-                ["status", "--porcelain"],
-                cwd=repo_dir
-            )
-            if result.returncode != 0:
-                return False
-            
-            changes = result.stdout.strip()
-            if not changes:
-                return False
-            
-            # Look for conflict markers (UU, AA, DD)
-            conflict_lines = []
-            for line in changes.split('\n'):
-                if line.strip() and line.startswith(('UU', 'AA', 'DD')):
-                    if exclude_manifest and "docs/docs_manifest.json" in line:
-                        continue
-                    conflict_lines.append(line)
-            
-            return len(conflict_lines) > 0
-        except Exception:
-            return False
+            return (str(repo_dir), (repo_dir / ".git" / "index").stat().st_mtime_ns)
+        except OSError:
+            return None
+    
+    def _parse_git_status_z(self, output: bytes) -> List[Tuple[str, str]]:
+        """Parse `git status --porcelain -z` output into (code, path) pairs"""
+        entries = []
+        fields = iter(output.split(b"\0"))
+        for entry in fields:
+            if not entry:
+                continue
+            code = entry[:2].decode("ascii", errors="replace")
+            entries.append((code, entry[3:].decode("utf-8", errors="surrogateescape")))
+            if "R" in code or "C" in code:
+                # Renames and copies are followed by an extra orig_path field
+                next(fields, None)
+        return entries
     
-    def _git_has_untracked_files(self, repo_dir: Path) -> bool:
+    def _git_has_uncommitted_changes(self, repo_dir: Path, exclude_manifest: bool = True,
+                                     status_entries: Optional[List[Tuple[str, str]]] = None) -> bool:
+        """Check if repository has uncommitted changes"""
+        if status_entries is None:
+            status_entries = self._git_status_porcelain(repo_dir)
+        
+        if exclude_manifest:
+            # Filter out docs_manifest.json changes
+            return any(path != MANIFEST_PATH for _, path in status_entries)
+        
+        return len(status_entries) > 0
+    
+    def _git_has_conflicts(self, repo_dir: Path, exclude_manifest: bool = True,
+                           status_entries: Optional[List[Tuple[str, str]]] = None) -> bool:
+        """Check if repository has merge conflicts"""
+        if status_entries is None:
+            status_entries = self._git_status_porcelain(repo_dir)
+        
+        # Look for conflict markers (UU, AA, DD)
+        for code, path in status_entries:
+            if code in ('UU', 'AA', 'DD'):
+                if exclude_manifest and path == MANIFEST_PATH:
+                    continue
+                return True
+        
+        return False
+    
+    def _git_has_untracked_files(self, repo_dir: Path,
+                                 status_entries: Optional[List[Tuple[str, str]]] = None) -> bool:
         """Check if repository has untracked files (excluding temp files)"""
+        if status_entries is None:
+            status_entries = self._git_status_porcelain(repo_dir)
+        
+        # Look for untracked files (??) but ignore temp files
+        temp_extensions = ('.tmp', '.log', '.swp')
+        return any(code == '??' and not path.endswith(temp_extensions)
+                   for code, path in status_entries)
+    
+    def _run_shell_script(self, script: str, cwd: Optional[Path] = None,
+                          timeout: int = 60, text: bool = True) -> subprocess.CompletedProcess:
+        """Run a script with the platform shell (cmd.exe on Windows, sh elsewhere)"""
+        if self.os_type == "windows":
+            comspec = os.environ.get("COMSPEC", "cmd.exe")
+            # /s strips the outer quotes and keeps the rest of the line verbatim
+            cmd = f'"{comspec}" /d /s /c "{script}"'
+        else:
+            cmd = ["/bin/sh", "-c", script]
+        
         try:
-            result = self._run_git_command(
-                ["status", "--porcelain"],
-                cwd=repo_dir
+            return subprocess.run(
+                cmd,
+                cwd=cwd,
+                capture_output=True,
+                text=text,
+                timeout=timeout
             )
-            if result.returncode != 0:
-                return False
-            
-            changes = result.stdout.strip()
-            if not changes:
-                return False
-            
-            # Look for untracked files (??) but ignore temp files
-            temp_extensions = ['.tmp', '.log', '.swp']
-            for line in changes.split('\n'):
-                if line.strip() and line.startswith('??'):
-                    filename = line[3:].strip()
-                    if not any(filename.endswith(ext) for ext in temp_extensions):
-                        return True
-            
-            return False
-        except Exception:
-            return False
+        except subprocess.TimeoutExpired:
+            raise RuntimeError(f"Shell command timed out: {script}")
     
-    def _git_abort_operations(self, repo_dir: Path):
-        """Abort any in-progress git operations"""
-        try:
-            # Abort merge
-            self._run_git_command(["merge", "--abort"], cwd=repo_dir)
-        except Exception:
-            pass
+    def _quote_git_executable(self, git_exe: str) -> str:
+        """Quote the git executable for use in a shell script"""
+        if self.os_type == "windows":
+            # Batch wrappers (git.cmd) must be invoked with call to return control
+            if git_exe.lower().endswith(('.cmd', '.bat')):
+                return f'call "{git_exe}"'
+            return f'"{git_exe}"'
+        return shlex.quote(git_exe)
+    
+    def _git_fetch_and_status(self, repo_dir: Path, target_branch: str,
+                              with_status: bool) -> Tuple[bool, Optional[List[Tuple[str, str]]]]:
+        """Fetch the target branch and optionally read `git status` in one shell invocation
         
-        try:
-            # Abort rebase
-            self._run_git_command(["rebase", "--abort"], cwd=repo_dir)
-        except Exception:
-            pass
+        Returns (fetched, status_entries). status_entries is None when it was
+        not requested or could not be read, so callers fall back to
+        _git_status_porcelain.
+        """
+        git_exe = self._find_git_executable()
+        if not git_exe:
+            return False, None
+        
+        git = self._quote_git_executable(git_exe)
+        if self.os_type == "windows":
+            null = "nul"
+        else:
+            null = "/dev/null"
+            target_branch = shlex.quote(target_branch)
+        
+        # The marker line separates the fetch result from the status output
+        script = (f"{git} fetch --quiet --no-tags origin {target_branch} >{null} 2>&1"
+                  f" && echo {_SCRIPT_OK}")
+        if with_status:
+            script += f" && {git} status --porcelain -z"
+        result = self._run_shell_script(script, cwd=repo_dir, text=False)
+        
+        marker, _, status_output = result.stdout.partition(b"\n")
+        if marker.strip() != _SCRIPT_OK.encode("ascii"):
+            return False, None
+        if not with_status or result.returncode != 0:
+            return True, None
+        
+        entries = self._parse_git_status_z(status_output)
+        cache_key = self._git_status_cache_key(repo_dir)
+        if cache_key is not None:
+            self._git_status_cache[cache_key] = entries
+        return True, entries
     
     def _git_force_clean_checkout(self, repo_dir: Path, target_branch: str) -> bool:
-        """Force a clean checkout to target branch"""
+        """Abort in-progress operations and force a clean checkout to target branch
+        
+        All steps run in a single shell invocation so git is only loaded
+        once instead of once per step.
+        """
         try:
-            # Clear any stale index
-            self._run_git_command(["reset"], cwd=repo_dir)
-            
-            # Force checkout target branch (handles detached HEAD, wrong branch, etc.)
-            result = self._run_git_command(
-                ["checkout", "-B", target_branch, f"origin/{target_branch}"],
-                cwd=repo_dir
-            )
-            if result.returncode != 0:
+            git_exe = self._find_git_executable()
+            if not git_exe:
                 return False
             
-            # Reset to clean state (discards all local changes)
-            result = self._run_git_command(
-                ["reset", "--hard", f"origin/{target_branch}"],
-                cwd=repo_dir
-            )
-            if result.returncode != 0:
-                return False
+            git = self._quote_git_executable(git_exe)
+            remote_branch = f"origin/{target_branch}"
             
-            # Clean any untracked files
-            self._run_git_command(["clean", "-fd"], cwd=repo_dir)
+            if self.os_type == "windows":
+                null, seq = "nul", "&"
+                clean_and_confirm = f"({git} clean -fdq & echo {_SCRIPT_OK})"
+            else:
+                null, seq = "/dev/null", ";"
+                target_branch = shlex.quote(target_branch)
+                remote_branch = shlex.quote(remote_branch)
+                clean_and_confirm = f"{{ {git} clean -fdq; echo {_SCRIPT_OK}; }}"
+            
+            # Only the confirmation line is read back, so keep git quiet
+            steps = [
+                # Abort any in-progress merge or rebase (failures are expected)
+                f"{git} merge --abort 2>{null}",
+                f"{git} rebase --abort 2>{null}",
+                # Clear any stale index
+                f"{git} reset -q",
+                # Force checkout target branch (handles detached HEAD, wrong branch, etc.),
+                # reset to clean state (discards all local changes) and clean untracked files
+                f"{git} checkout -q -B {target_branch} {remote_branch}"
+                f" && {git} reset -q --hard {remote_branch}"
+                f" && {clean_and_confirm}",
+            ]
+            result = self._run_shell_script(f" {seq} ".join(steps), cwd=repo_dir)
             
-            return True
+            return _SCRIPT_OK in result.stdout
         except Exception:
             return False
     
     def _safe_git_update(self, repo_dir: Path) -> bool:
         """Safely update git repository - Python implementation of bash safe_git_update()"""
         try:
-            # Get current branch
-            current_branch = self._git_get_current_branch(repo_dir)
+            # Route the read-only queries below through one long-lived shell
+            git_exe = self._find_git_executable()
+            if git_exe:
+                self._git_session = GitSession(git_exe, repo_dir, self.os_type).start()
+            
+            # Get current branch and pull strategy in one round-trip
+            current_branch = "unknown"
+            pull_rebase_result = None
+            try:
+                branch_result, pull_rebase_result = self._git_query_many([
+                    ["rev-parse", "--abbrev-ref", "HEAD"],
+                    ["config", "pull.rebase"],
+                ], cwd=repo_dir)
+                if branch_result.returncode == 0:
+                    current_branch = branch_result.stdout.strip()
+            except Exception:
+                pass
             target_branch = INSTALL_BRANCH
             
             # Inform user about branch status
@@ -331,8 +767,7 @@ class CrossPlatformInstaller:
             
             # Set git config for pull strategy if not set
             try:
-                result = self._run_git_command(["config", "pull.rebase"], cwd=repo_dir)
-                if result.returncode != 0:
+                if pull_rebase_result is not None and pull_rebase_result.returncode != 0:
                     self._run_git_command(["config", "pull.rebase", "false"], cwd=repo_dir)
             except Exception:
                 pass
@@ -342,9 +777,11 @@ class CrossPlatformInstaller:
             # Try regular pull first
             try:
                 result = self._run_git_command(
-                    ["pull", "--quiet", "origin", target_branch],
+                    ["pull", "--quiet", "--no-tags", "origin", target_branch],
                     cwd=repo_dir,
-                    timeout=60
+                    timeout=60,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL
                 )
                 if result.returncode == 0:
                     return True
@@ -354,29 +791,30 @@ class CrossPlatformInstaller:
             # If pull failed, try more aggressive approach
             print("  Standard update failed, trying harder...")
             
-            # Fetch latest
+            # Fetch latest, reading status in the same shell when it will be needed
+            staying_on_branch = current_branch == target_branch
             try:
-                result = self._run_git_command(
-                    ["fetch", "origin", target_branch],
-                    cwd=repo_dir,
-                    timeout=60
-                )
-                if result.returncode != 0:
-                    print("  [!] Could not fetch from GitHub (offline?)")
-                    return False
+                fetched, status_entries = self._git_fetch_and_status(
+                    repo_dir, target_branch, with_status=staying_on_branch)
             except Exception:
+                fetched, status_entries = False, None
+            if not fetched:
                 print("  [!] Could not fetch from GitHub (offline?)")
                 return False
             
             # If we're switching branches, skip change detection - just force clean
             needs_user_confirmation = False
-            if current_branch != target_branch:
+            if not staying_on_branch:
                 print("  Branch switch detected, forcing clean state...")
             else:
                 # Check what kind of changes we have (only when staying on same branch)
-                has_conflicts = self._git_has_conflicts(repo_dir, exclude_manifest=True)
-                has_local_changes = self._git_has_uncommitted_changes(repo_dir, exclude_manifest=True)
-                has_untracked = self._git_has_untracked_files(repo_dir)
+                if status_entries is None:
+                    status_entries = self._git_status_porcelain(repo_dir)
+                has_conflicts = self._git_has_conflicts(
+                    repo_dir, exclude_manifest=True, status_entries=status_entries)
+                has_local_changes = self._git_has_uncommitted_changes(
+                    repo_dir, exclude_manifest=True, status_entries=status_entries)
+                has_untracked = self._git_has_untracked_files(repo_dir, status_entries=status_entries)
                 
                 needs_user_confirmation = has_conflicts or has_local_changes or has_untracked
                 
@@ -395,32 +833,32 @@ class CrossPlatformInstaller:
                     print("Note: Changes to docs_manifest.json are handled automatically.")
                     print("")
                     
-                    # Ask for confirmation
-                    try:
-                        response = input("Continue and discard local changes? [y/N]: ").strip().lower()
-                        if response not in ['y', 'yes']:
-                            print("Installation cancelled. Your local changes are preserved.")
-                            print("To proceed later, either:")
-                            print("  1. Manually resolve the issues, or")
-                            print("  2. Run the installer again and choose 'y' to discard changes")
+                    # Ask for confirmation (unless told to assume yes)
+                    if self.assume_yes:
+                        print("Assuming yes (--yes), continuing without prompting.")
+                    else:
+                        try:
+                            response = input("Continue and discard local changes? [y/N]: ").strip().lower()
+                            if response not in ['y', 'yes']:
+                                print("Installation cancelled. Your local changes are preserved.")
+                                print("To proceed later, either:")
+                                print("  1. Manually resolve the issues, or")
+                                print("  2. Run the installer again and choose 'y' to discard changes")
+                                return False
+                        except (EOFError, KeyboardInterrupt):
+                            print("\nInstallation cancelled.")
                             return False
-                    except (EOFError, KeyboardInterrupt):
-                        print("\nInstallation cancelled.")
-                        return False
                     
                     print("  Proceeding with clean installation...")
                 else:
                     # Check for manifest-only changes
-                    result = self._run_git_command(["status", "--porcelain"], cwd=repo_dir)
-                    if result.returncode == 0:
-                        manifest_changes = [line for line in result.stdout.split('\n') 
-                                          if line.strip() and "docs/docs_manifest.json" in line]
-                        if manifest_changes:
-                            conflict_markers = [line for line in manifest_changes if line.startswith('UU')]
-                            if conflict_markers:
-                                print("  Resolving manifest file conflicts automatically...")
-                            else:
-                                print("  Handling manifest file updates automatically...")
+                    manifest_codes = [code for code, path in status_entries
+                                      if path == MANIFEST_PATH]
+                    if manifest_codes:
+                        if 'UU' in manifest_codes:
+                            print("  Resolving manifest file conflicts automatically...")
+                        else:
+                            print("  Handling manifest file updates automatically...")
             
             # Force clean state
             if needs_user_confirmation:
@@ -428,10 +866,7 @@ class CrossPlatformInstaller:
             else:
                 print("  Updating to clean state...")
             
-            # Abort any in-progress operations
-            self._git_abort_operations(repo_dir)
-            
-            # Force clean checkout
+            # Abort any in-progress operations and force clean checkout
             if self._git_force_clean_checkout(repo_dir, target_branch):
                 print("  [+] Updated successfully to clean state")
                 return True
@@ -442,6 +877,10 @@ class CrossPlatformInstaller:
         except Exception as e:
             print(f"  [!] Error during git update: {e}")
             return False
+        finally:
+            if self._git_session is not None:
+                self._git_session.close()
+                self._git_session = None
     
     def _create_windows_helper_scripts(self) -> bool:
         """Create Windows batch and PowerShell helper scripts"""
@@ -449,7 +888,8 @@ class CrossPlatformInstaller:
             # Create batch file wrapper for Command Prompt
             batch_script = self.install_dir / "claude-docs-helper.bat"
             # Convert Windows paths to forward slashes for bash compatibility
-            bash_install_dir = str(self.install_dir).replace('\\', '/')
+            bash_install_dir = self._install_dir_str.replace('\\', '/')
+            python_helper = self.install_dir / "claude-docs-helper.py"
             
             batch_content = f'''@echo off
 REM Claude Code Docs Helper - Windows Batch Wrapper
@@ -469,7 +909,7 @@ REM Fallback: Try to use PowerShell to run a Python equivalent
 where python >nul 2>nul
 if %errorlevel% == 0 (
     REM Python is available, use it to run our Python helper
-    python "{self.install_dir / "claude-docs-helper.py"}" %*
+    python "{python_helper}" %*
     exit /b %errorlevel%
 )
 
@@ -499,7 +939,7 @@ if (Get-Command bash -ErrorAction SilentlyContinue) {{
 # Check if python is available
 if (Get-Command python -ErrorAction SilentlyContinue) {{
     # Use Python to run our Python helper
-    & python "{self.install_dir / "claude-docs-helper.py"}" @Arguments
+    & python "{python_helper}" @Arguments
     exit $LASTEXITCODE
 }}
 
@@ -510,11 +950,8 @@ exit 1
 '''
             
             # Write the files
-            with open(batch_script, 'w', encoding='utf-8') as f:
-                f.write(batch_content)
-            
-            with open(ps_script, 'w', encoding='utf-8') as f:
-                f.write(ps_content)
+            batch_script.write_text(batch_content, encoding='utf-8')
+            ps_script.write_text(ps_content, encoding='utf-8')
             
             print(f"[+] Created Windows helper scripts")
             return True
@@ -527,6 +964,13 @@ exit 1
         """Check for required tools and system capabilities"""
         print("Checking dependencies...")
         
+        # Informational checks never block the install, so run them alongside the
+        # blocking checks below and report them before anything is written
+        self._background_checks = threading.Thread(
+            target=self._run_background_checks, daemon=True
+        )
+        self._background_checks.start()
+        
         all_good = True
         
         # 1. Python Version Check
@@ -539,24 +983,32 @@ exit 1
             print("    Please upgrade Python and try again")
             all_good = False
         
-        # 2. Git Detection (cross-platform)
-        git_found = self._check_git_availability()
-        if not git_found:
-            all_good = False
+        # The remaining blocking checks are independent (subprocess, socket and
+        # disk IO), so run them concurrently and print their output in a stable order
+        checks = [
+            self._check_git_availability,       # 2. Git Detection (cross-platform)
+            self._check_network_connectivity,   # 3. Network Connectivity Test
+            self._check_directory_permissions,  # 4. Directory Permissions
+        ]
+        messages = []
+        messages_lock = threading.Lock()
         
-        # 3. Network Connectivity Test
-        if not self._check_network_connectivity():
-            all_good = False
+        def run_check(order: int, check: Callable[..., bool]) -> bool:
+            def emit(message: str):
+                with messages_lock:
+                    messages.append((order, message))
+            return check(emit=emit)
         
-        # 4. Directory Permissions
-        if not self._check_directory_permissions():
-            all_good = False
+        with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+            futures = [executor.submit(run_check, order, check)
+                       for order, check in enumerate(checks)]
+            results = [future.result() for future in futures]
         
-        # 5. Disk Space Check (optional but informative)
-        self._check_disk_space()
+        # Stable sort keeps each check's own messages in emission order
+        for _, message in sorted(messages, key=lambda item: item[0]):
+            print(message)
         
-        # 6. Platform-specific checks
-        if not self._check_platform_specific():
+        if not all(results):
             all_good = False
         
         if all_good:
@@ -567,7 +1019,23 @@ exit 1
             return False
 
     
-    def _check_git_availability(self) -> bool:
+    def _run_background_checks(self):
+        """Run the informational checks, buffering their output"""
+        emit = self._background_messages.append
+        self._check_disk_space(emit=emit)         # 5. Disk Space Check (optional but informative)
+        self._check_platform_specific(emit=emit)  # 6. Platform-specific checks
+    
+    def _report_background_checks(self):
+        """Wait for the informational checks and print their results"""
+        if self._background_checks is None:
+            return
+        self._background_checks.join()
+        self._background_checks = None
+        for message in self._background_messages:
+            print(message)
+        self._background_messages = []
+    
+    def _check_git_availability(self, emit: Callable[[str], None] = print) -> bool:
         """Check if git is available and working"""
         # Use the existing git detection logic
         git_exe = self._find_git_executable()
@@ -581,53 +1049,52 @@ exit 1
                 )
                 if result.returncode == 0:
                     version_line = result.stdout.strip()
-                    print(f"[+] Git found: {version_line}")
+                    emit(f"[+] Git found: {version_line}")
                     return True
             except Exception as e:
-                print(f"[!] Git test failed: {e}")
+                emit(f"[!] Git test failed: {e}")
         
         # Provide platform-specific installation guidance
-        print("[!] Error: Git is required but not found")
-        print("    Please install Git and try again:")
+        emit("[!] Error: Git is required but not found")
+        emit("    Please install Git and try again:")
         
         if self.os_type == "windows":
-            print("    • Download from: https://git-scm.com/download/windows")
-            print("    • Or install via winget: winget install Git.Git")
-            print("    • Or install via chocolatey: choco install git")
+            emit("    • Download from: https://git-scm.com/download/windows")
+            emit("    • Or install via winget: winget install Git.Git")
+            emit("    • Or install via chocolatey: choco install git")
         elif self.os_type == "macos":
-            print("    • Install Xcode Command Line Tools: xcode-select --install")
-            print("    • Or install via Homebrew: brew install git")
-            print("    • Or install via MacPorts: port install git")
+            emit("    • Install Xcode Command Line Tools: xcode-select --install")
+            emit("    • Or install via Homebrew: brew install git")
+            emit("    • Or install via MacPorts: port install git")
         elif self.os_type == "linux":
-            print("    • Ubuntu/Debian: sudo apt install git")
-            print("    • Fedora/RHEL: sudo dnf install git")
-            print("    • Arch: sudo pacman -S git")
-            print("    • SUSE: sudo zypper install git")
+            emit("    • Ubuntu/Debian: sudo apt install git")
+            emit("    • Fedora/RHEL: sudo dnf install git")
+            emit("    • Arch: sudo pacman -S git")
+            emit("    • SUSE: sudo zypper install git")
         
         return False
     
-    def _check_network_connectivity(self) -> bool:
-        """Test network connectivity to GitHub"""
+    def _check_network_connectivity(self, emit: Callable[[str], None] = print) -> bool:
+        """Test network connectivity to GitHub
+        
+        Only name resolution is checked here; the full TCP handshake is left
+        to the git clone/fetch, which reports connection failures on its own.
+        """
+        import socket
         try:
-            import socket
-            # Test connection to GitHub
-            with socket.create_connection(("github.com", 443), timeout=10):
-                print("[+] Network connectivity: OK")
-                return True
-        except socket.timeout:
-            print("[!] Error: Network timeout connecting to github.com")
-            print("    Please check your internet connection")
-            return False
+            socket.getaddrinfo("github.com", 443, type=socket.SOCK_STREAM)
+            emit("[+] Network connectivity: OK")
+            return True
         except socket.gaierror as e:
-            print(f"[!] Error: DNS resolution failed for github.com: {e}")
-            print("    Please check your DNS settings")
+            emit(f"[!] Error: DNS resolution failed for github.com: {e}")
+            emit("    Please check your DNS settings")
             return False
         except Exception as e:
-            print(f"[!] Error: Network connectivity test failed: {e}")
-            print("    Please check your internet connection and firewall settings")
+            emit(f"[!] Error: Network connectivity test failed: {e}")
+            emit("    Please check your internet connection and firewall settings")
             return False
     
-    def _check_directory_permissions(self) -> bool:
+    def _check_directory_permissions(self, emit: Callable[[str], None] = print) -> bool:
         """Check write permissions to required directories"""
         directories_to_check = [
             ("Install directory parent", self.install_dir.parent),
@@ -641,115 +1108,105 @@ exit 1
                 # Ensure directory exists
                 directory.mkdir(parents=True, exist_ok=True)
                 
-                # Test write permissions
-                test_file = directory / ".claude-docs-install-test"
-                test_file.write_text("permission test")
-                test_file.unlink()
+                # Test write permissions - access(2) answers the common case;
+                # only confirm with a real write when it reports no access,
+                # since it can be wrong about ACLs on Windows
+                if not os.access(directory, os.W_OK):
+                    test_file = directory / ".claude-docs-install-test"
+                    test_file.write_text("permission test")
+                    test_file.unlink()
                 
-                print(f"[+] Write permissions OK: {desc} ({directory})")
+                emit(f"[+] Write permissions OK: {desc} ({directory})")
                 
             except PermissionError:
-                print(f"[!] Error: No write permission to {desc} ({directory})")
+                emit(f"[!] Error: No write permission to {desc} ({directory})")
                 if self.os_type == "windows":
-                    print("    Try running as Administrator or check folder permissions")
+                    emit("    Try running as Administrator or check folder permissions")
                 else:
-                    print("    Try running with sudo or check folder permissions")
+                    emit("    Try running with sudo or check folder permissions")
                 all_good = False
             except Exception as e:
-                print(f"[!] Error: Cannot write to {desc} ({directory}): {e}")
+                emit(f"[!] Error: Cannot write to {desc} ({directory}): {e}")
                 all_good = False
         
         return all_good
     
-    def _check_disk_space(self, min_space_mb: int = 50) -> bool:
+    def _check_disk_space(self, min_space_mb: int = 50,
+                          emit: Callable[[str], None] = print) -> bool:
         """Check available disk space (informational)"""
         try:
-            total, used, free = shutil.disk_usage(self.install_dir.parent)
+            # Runs alongside the permission check, which may not have created
+            # the install parent yet, so measure the nearest existing ancestor
+            target = self.install_dir.parent
+            while not target.exists() and target.parent != target:
+                target = target.parent
+            total, used, free = shutil.disk_usage(target)
             free_mb = free // (1024 * 1024)
             
             if free_mb >= min_space_mb:
-                print(f"[+] Disk space: {free_mb} MB available")
+                emit(f"[+] Disk space: {free_mb} MB available")
                 return True
             else:
-                print(f"[!] Warning: Low disk space - {free_mb} MB available (recommended: {min_space_mb} MB)")
-                print("    Installation may fail if disk becomes full")
+                emit(f"[!] Warning: Low disk space - {free_mb} MB available (recommended: {min_space_mb} MB)")
+                emit("    Installation may fail if disk becomes full")
                 return False
                 
         except Exception as e:
-            print(f"[!] Warning: Could not check disk space: {e}")
+            emit(f"[!] Warning: Could not check disk space: {e}")
             return True  # Not critical, so don't fail
     
-    def _check_platform_specific(self) -> bool:
+    def _check_platform_specific(self, emit: Callable[[str], None] = print) -> bool:
         """Platform-specific dependency checks"""
         all_good = True
         
         if self.os_type == "windows":
-            # Check for PowerShell or Command Prompt compatibility
-            try:
-                # Test basic subprocess functionality
-                result = subprocess.run(
-                    ["cmd", "/c", "echo", "test"],
-                    capture_output=True,
-                    text=True,
-                    timeout=5
-                )
-                if result.returncode == 0:
-                    print("[+] Windows Command Prompt: Available")
-                else:
-                    print("[!] Warning: Windows Command Prompt test failed")
-            except Exception:
-                print("[!] Warning: Cannot execute Windows commands")
+            # Check for PowerShell or Command Prompt compatibility by looking
+            # for the binaries instead of spawning them
+            system32 = Path(os.environ.get("SystemRoot", r"C:\Windows")) / "System32"
+            
+            if (system32 / "cmd.exe").is_file():
+                emit("[+] Windows Command Prompt: Available")
+            else:
+                emit("[!] Warning: Windows Command Prompt not found")
             
             # Check for PowerShell
-            try:
-                result = subprocess.run(
-                    ["powershell", "-Command", "Write-Host test"],
-                    capture_output=True,
-                    text=True,
-                    timeout=5
-                )
-                if result.returncode == 0:
-                    print("[+] PowerShell: Available")
-                else:
-                    print("[i] PowerShell: Not available (not required)")
-            except Exception:
-                print("[i] PowerShell: Not available (not required)")
+            if (system32 / "WindowsPowerShell" / "v1.0" / "powershell.exe").is_file():
+                emit("[+] PowerShell: Available")
+            else:
+                emit("[i] PowerShell: Not available (not required)")
                 
         elif self.os_type == "macos":
             # Check for basic Unix tools
-            try:
-                result = subprocess.run(
-                    ["which", "bash"],
-                    capture_output=True,
-                    text=True,
-                    timeout=5
-                )
-                if result.returncode == 0:
-                    print("[+] macOS: Bash shell available")
-                else:
-                    print("[!] Warning: Bash shell not found")
-            except Exception:
-                print("[!] Warning: Cannot check for bash shell")
+            if shutil.which("bash") is not None:
+                emit("[+] macOS: Bash shell available")
+            else:
+                emit("[!] Warning: Bash shell not found")
                 
         elif self.os_type == "linux":
             # Check for basic Unix tools
-            try:
-                result = subprocess.run(
-                    ["which", "bash"],
-                    capture_output=True,
-                    text=True,
-                    timeout=5
-                )
-                if result.returncode == 0:
-                    print("[+] Linux: Bash shell available")
-                else:
-                    print("[!] Warning: Bash shell not found")
-            except Exception:
-                print("[!] Warning: Cannot check for bash shell")
+            if shutil.which("bash") is not None:
+                emit("[+] Linux: Bash shell available")
+            else:
+                emit("[!] Warning: Bash shell not found")
         
         return all_good
 
 
+    def _claude_docs_dir(self, path_str: str) -> Optional[str]:
+        """Trim a path to its claude-code-docs directory (None if it has none)
+        
+        Same result as matching (.*/claude-code-docs)(/.*)?$, using rpartition
+        for the common case.
+        """
+        head, sep, tail = path_str.rpartition('/claude-code-docs')
+        if not sep:
+            return None
+        if not tail or tail.startswith('/'):
+            return head + sep
+        # The last occurrence is part of a longer name (e.g. claude-code-docs-fork)
+        dir_match = _DIR_RE.match(path_str)
+        return dir_match.group(1) if dir_match else None
+    
     def find_existing_installations(self) -> List[Path]:
         """Find existing claude-code-docs installations from config files
         
@@ -757,49 +1214,71 @@ exit 1
         Searches ~/.claude/commands/docs.md and ~/.claude/settings.json for
         installation paths from various versions.
         """
-        paths = []
+        # Resolved candidate directories, kept as strings until the result is built.
+        # Candidates are deduplicated as they are found, excluding the new location
+        # (bash: printf '%s\n' "${paths[@]}" | grep -v "^$INSTALL_DIR$" | sort -u)
+        found_paths = set()
+        seen_candidates = set()
+        install_abs = os.path.realpath(self.install_dir)
+        
+        def add_candidate(path_str: str):
+            if path_str in seen_candidates:
+                return
+            seen_candidates.add(path_str)
+            abs_str = os.path.realpath(path_str)
+            if abs_str != install_abs:
+                found_paths.add(abs_str)
+        
+        # The same candidate often appears in both files and several hooks
+        @functools.lru_cache(maxsize=None)
+        def is_dir(path_str: str) -> bool:
+            return os.path.isdir(path_str)
         
         # Check command file for paths
         docs_command_file = self.claude_dir / "commands" / "docs.md"
         if docs_command_file.exists():
             try:
-                with open(docs_command_file, 'r', encoding='utf-8') as f:
-                    for line in f:
-                        line = line.strip()
-                        
-                        # v0.1 format: LOCAL DOCS AT: /path/to/claude-code-docs/docs/
-                        # Pattern: LOCAL\ DOCS\ AT:\ ([^[:space:]]+)/docs/
-                        v01_match = re.search(r'LOCAL\s+DOCS\s+AT:\s+([^\s]+)/docs/', line)
-                        if v01_match:
-                            path_str = v01_match.group(1)
+                # Read the file once and let the regex engine pick out just the
+                # lines that can mention an installation
+                data = docs_command_file.read_text(encoding='utf-8', errors='replace')
+                for line_match in _DOCS_LINE_RE.finditer(data):
+                    line = line_match.group().strip()
+                    
+                    # v0.1 format: LOCAL DOCS AT: /path/to/claude-code-docs/docs/
+                    # Pattern: LOCAL\ DOCS\ AT:\ ([^[:space:]]+)/docs/
+                    _, v01_marker, rest = line.partition('LOCAL DOCS AT: ')
+                    if v01_marker and rest.strip():
+                        path_str, docs_sep, _ = rest.split()[0].rpartition('/docs/')
+                        if docs_sep and path_str:
                             # Convert ~ to home directory (bash: ${path/#\~/$HOME})
                             if path_str.startswith('~'):
-                                path_str = str(Path.home()) + path_str[1:]
+                                path_str = self._home_str + path_str[1:]
                             
-                            path = Path(path_str)
-                            if path.is_dir():
-                                paths.append(path)
+                            if is_dir(path_str):
+                                add_candidate(path_str)
+                    
+                    # v0.2+ format: Execute: /path/to/claude-code-docs/helper.sh
+                    # Pattern: Execute:.*claude-code-docs
+                    _, execute_marker, rest = line.partition('Execute:')
+                    if execute_marker and 'claude-code-docs' in rest:
+                        # Take the first token containing claude-code-docs
+                        # (bash: grep -o '[^ "]*claude-code-docs[^ "]*' | head -1)
+                        path_str = next(token for token in line.replace('"', ' ').split(' ')
+                                        if 'claude-code-docs' in token)
                         
-                        # v0.2+ format: Execute: /path/to/claude-code-docs/helper.sh
-                        # Pattern: Execute:.*claude-code-docs
-                        if re.search(r'Execute:.*claude-code-docs', line):
-                            # Extract path from various formats (bash: grep -o '[^ "]*claude-code-docs[^ "]*')
-                            path_matches = re.findall(r'[^ "]*claude-code-docs[^ "]*', line)
-                            if path_matches:
-                                path_str = path_matches[0]  # Take first match (equivalent to head -1)
-                                
-                                # Convert ~ to home directory
-                                if path_str.startswith('~'):
-                                    path_str = str(Path.home()) + path_str[1:]
+                        # Convert ~ to home directory
+                        if path_str.startswith('~'):
+                            path_str = self._home_str + path_str[1:]
+                        
+                        # Get directory part
+                        if is_dir(path_str):
+                            add_candidate(path_str)
+                        else:
+                            # If path points to a file, check if parent dir is claude-code-docs
+                            parent_str = os.path.dirname(path_str.rstrip('/\\'))
+                            if os.path.basename(parent_str) == "claude-code-docs" and is_dir(parent_str):
+                                add_candidate(parent_str)
                                 
-                                path = Path(path_str)
-                                # Get directory part
-                                if path.is_dir():
-                                    paths.append(path)
-                                elif path.parent.is_dir() and path.parent.name == "claude-code-docs":
-                                    # If path points to a file, check if parent dir is claude-code-docs
-                                    paths.append(path.parent)
-                                    
             except Exception as e:
                 # Don't fail installation if we can't read command file
                 print(f"[!] Warning: Could not read command file {docs_command_file}: {e}")
@@ -808,8 +1287,9 @@ exit 1
         settings_file = self.claude_dir / "settings.json"
         if settings_file.exists():
             try:
-                with open(settings_file, 'r', encoding='utf-8') as f:
-                    settings_data = json.load(f)
+                # Only parse the JSON when the raw bytes could contain a hit
+                raw_settings = settings_file.read_bytes()
+                settings_data = json.loads(raw_settings) if b"claude-code-docs" in raw_settings else {}
                 
                 # Extract hook commands (bash: jq -r '.hooks.PreToolUse[]?.hooks[]?.command // empty')
                 pre_tool_use_hooks = settings_data.get("hooks", {}).get("PreToolUse", [])
@@ -823,46 +1303,36 @@ exit 1
                                     # Extract paths from v0.1 complex hook format
                                     # Look for patterns like: "/path/to/claude-code-docs/.last_check"
                                     # Pattern: grep -o '"[^"]*claude-code-docs[^"]*"' | sed 's/"//g'
-                                    quoted_paths = re.findall(r'"[^"]*claude-code-docs[^"]*"', cmd)
-                                    for quoted_path in quoted_paths:
-                                        path_str = quoted_path.strip('"')  # Remove quotes
-                                        if not path_str:
-                                            continue
+                                    # (the group excludes the quotes and is never empty)
+                                    for quoted_match in _QUOTED_RE.finditer(cmd):
+                                        path_str = quoted_match.group('p')
                                         
                                         # Extract just the directory part
-                                        # Pattern: (.*/claude-code-docs)(/.*)?$
-                                        dir_match = re.match(r'(.*/claude-code-docs)(/.*)?$', path_str)
-                                        if dir_match:
-                                            path_str = dir_match.group(1)
-                                            
+                                        path_str = self._claude_docs_dir(path_str)
+                                        if path_str:
                                             # Convert ~ to home directory
                                             if path_str.startswith('~'):
-                                                path_str = str(Path.home()) + path_str[1:]
+                                                path_str = self._home_str + path_str[1:]
                                             
-                                            path = Path(path_str)
-                                            if path.is_dir():
-                                                paths.append(path)
+                                            if is_dir(path_str):
+                                                add_candidate(path_str)
                                     
                                     # Also try v0.2+ simpler format
                                     # Pattern: grep -o '[^ "]*claude-code-docs[^ "]*'
-                                    simple_paths = re.findall(r'[^ "]*claude-code-docs[^ "]*', cmd)
+                                    simple_paths = _UNQUOTED_RE.findall(cmd)
                                     for path_str in simple_paths:
                                         if not path_str:
                                             continue
                                         
                                         # Convert ~ to home directory
                                         if path_str.startswith('~'):
-                                            path_str = str(Path.home()) + path_str[1:]
+                                            path_str = self._home_str + path_str[1:]
                                         
                                         # Clean up path to get the claude-code-docs directory
-                                        # Pattern: (.*/claude-code-docs)(/.*)?$
-                                        dir_match = re.match(r'(.*/claude-code-docs)(/.*)?$', path_str)
-                                        if dir_match:
-                                            path_str = dir_match.group(1)
+                                        path_str = self._claude_docs_dir(path_str) or path_str
                                         
-                                        path = Path(path_str)
-                                        if path.is_dir():
-                                            paths.append(path)
+                                        if is_dir(path_str):
+                                            add_candidate(path_str)
                                             
             except (json.JSONDecodeError, FileNotFoundError) as e:
                 # Don't fail installation if we can't read settings file
@@ -872,37 +1342,21 @@ exit 1
         current_dir = Path.cwd()
         manifest_file = current_dir / "docs" / "docs_manifest.json"
         if manifest_file.exists() and current_dir != self.install_dir:
-            paths.append(current_dir)
-        
-        # Deduplicate and exclude new location (bash: printf '%s\n' "${paths[@]}" | grep -v "^$INSTALL_DIR$" | sort -u)
-        unique_paths = []
-        seen_paths = set()
+            add_candidate(str(current_dir))
         
-        for path in paths:
-            # Resolve to absolute path for comparison
-            abs_path = path.resolve()
-            install_abs = self.install_dir.resolve()
-            
-            # Skip if this is the install directory or if we've seen this path
-            if abs_path != install_abs and abs_path not in seen_paths:
-                unique_paths.append(abs_path)
-                seen_paths.add(abs_path)
-        
-        # Sort for consistent output
-        unique_paths.sort()
-        
-        return unique_paths
+        # Sort the strings for consistent output, creating Path objects only for the result
+        return [Path(path_str) for path_str in sorted(found_paths)]
     
     def clone_or_update_repo(self) -> bool:
         """Clone new repo or update existing one - Main implementation"""
-        print("")
-        print("Checking repository status...")
+        _log("", "Checking repository status...")
         
-        # Check if already installed at target location
+        # Check if already installed at target location (a plain update never
+        # needs the scan for old installations)
         manifest_file = self.install_dir / "docs" / "docs_manifest.json"
-        if self.install_dir.exists() and manifest_file.exists():
-            print(f"[+] Found installation at {self.install_dir}")
-            print("  Updating to latest version...")
+        if manifest_file.exists():
+            _log(f"[+] Found installation at {self.install_dir}",
+                 "  Updating to latest version...")
             
             # Update it safely
             if self._safe_git_update(self.install_dir):
@@ -917,14 +1371,14 @@ exit 1
             if len(self.old_installations) > 0:
                 # Migration case - do fresh install
                 old_install = self.old_installations[0]
-                print(f"[+] Found existing installation at: {old_install}")
-                print(f"   Migrating to: {self.install_dir}")
-                print("")
+                _log(f"[+] Found existing installation at: {old_install}",
+                     f"   Migrating to: {self.install_dir}",
+                     "")
                 return self._migrate_installation(old_install)
             else:
                 # Fresh installation
-                print("No existing installation found")
-                print(f"Installing fresh to {self.install_dir}...")
+                _log("No existing installation found",
+                     f"Installing fresh to {self.install_dir}...")
                 return self._fresh_clone()
     
     def _migrate_installation(self, old_dir: Path) -> bool:
@@ -951,12 +1405,11 @@ exit 1
                 except Exception as e:
                     print(f"[!] Could not remove old installation: {e}")
             else:
-                print("")
-                print(f"[i] Old installation preserved at: {old_dir}")
-                print("   (has uncommitted changes)")
+                _log("",
+                     f"[i] Old installation preserved at: {old_dir}",
+                     "   (has uncommitted changes)")
             
-            print("")
-            print("[+] Migration complete!")
+            _log("", "[+] Migration complete!")
             return True
             
         except Exception as e:
@@ -977,10 +1430,14 @@ exit 1
                     print(f"[!] Could not remove incomplete installation: {e}")
                     return False
             
-            # Clone the repository
+            # Clone the repository - only the install branch, no tags, and no
+            # historical file contents (commits and trees are kept, so the
+            # helper's "what's new" history still works; a filtered clone
+            # reuses the filter on later fetches)
             print(f"Cloning repository to {self.install_dir}...")
             result = self._run_git_command([
-                "clone", "-b", INSTALL_BRANCH, REPO_URL, str(self.install_dir)
+                "clone", "--filter=blob:none", "--single-branch", "--no-tags",
+                "-b", INSTALL_BRANCH, REPO_URL, self._install_dir_str
             ], timeout=120)
             
             if result.returncode != 0:
@@ -995,6 +1452,10 @@ exit 1
                 print("[!] Clone appears incomplete - missing docs_manifest.json")
                 return False
             
+            # Now that .git exists, cache the git path for future runs
+            if self.git_executable:
+                self._save_cached_git_executable(self.git_executable)
+            
             print("[+] Repository cloned successfully")
             return True
             
@@ -1099,8 +1560,8 @@ if __name__ == "__main__":
             helper_script = self.install_dir / "claude-docs-helper.sh"
             
             if template_file.exists():
-                # Copy template to helper script
-                shutil.copy2(template_file, helper_script)
+                # Copy template to helper script (mode is set below, so skip copystat)
+                helper_script.write_bytes(template_file.read_bytes())
                 
                 # Make executable on Unix-like systems
                 if self.os_type != "windows":
@@ -1165,92 +1626,19 @@ if __name__ == "__main__":
                     return False
                 
                 # Use Python directly for better compatibility with Claude
-                python_helper_path = str(self.install_dir / "claude-docs-helper.py")
+                python_helper_path = os.path.join(self._install_dir_str, "claude-docs-helper.py")
                 
                 # Create the command content that works on Windows
-                command_content = f'''Execute the Claude Code Docs helper script using Python
-
-Usage:
-- /docs - List all available documentation topics
-- /docs <topic> - Read specific documentation with link to official docs
-- /docs -t - Check sync status without reading a doc
-- /docs -t <topic> - Check freshness then read documentation
-- /docs whats new - Show recent documentation changes (or "what's new")
-
-Examples of expected output:
-
-When reading a doc:
-📚 COMMUNITY MIRROR: https://github.com/ericbuess/claude-code-docs
-📖 OFFICIAL DOCS: https://docs.anthropic.com/en/docs/claude-code
-
-[Doc content here...]
-
-📖 Official page: https://docs.anthropic.com/en/docs/claude-code/hooks
-
-When showing what's new:
-📚 Recent documentation updates:
-
-• 5 hours ago:
-  📎 https://github.com/ericbuess/claude-code-docs/commit/eacd8e1
-  📄 data-usage: https://docs.anthropic.com/en/docs/claude-code/data-usage
-     ➕ Added: Privacy safeguards
-  📄 security: https://docs.anthropic.com/en/docs/claude-code/security
-     ✨ Data flow and dependencies section moved here
-
-📎 Full changelog: https://github.com/ericbuess/claude-code-docs/commits/main/docs
-📚 COMMUNITY MIRROR - NOT AFFILIATED WITH ANTHROPIC
-
-Every request checks for the latest documentation from GitHub (takes ~0.4s).
-The helper script handles all functionality including auto-updates.
-
-Execute: python "{python_helper_path}" $ARGUMENTS
-'''
+                command_content = _WINDOWS_COMMAND_TEMPLATE.format(helper=python_helper_path)
             else:
                 # Unix-style path for macOS and Linux
-                helper_path = str(self.install_dir / "claude-docs-helper.sh")
+                helper_path = os.path.join(self._install_dir_str, "claude-docs-helper.sh")
                 
                 # Create the command content with Unix-style paths
-                command_content = f'''Execute the Claude Code Docs helper script at {helper_path}
-
-Usage:
-- /docs - List all available documentation topics
-- /docs <topic> - Read specific documentation with link to official docs
-- /docs -t - Check sync status without reading a doc
-- /docs -t <topic> - Check freshness then read documentation
-- /docs whats new - Show recent documentation changes (or "what's new")
-
-Examples of expected output:
-
-When reading a doc:
-📚 COMMUNITY MIRROR: https://github.com/ericbuess/claude-code-docs
-📖 OFFICIAL DOCS: https://docs.anthropic.com/en/docs/claude-code
-
-[Doc content here...]
-
-📖 Official page: https://docs.anthropic.com/en/docs/claude-code/hooks
-
-When showing what's new:
-📚 Recent documentation updates:
-
-• 5 hours ago:
-  📎 https://github.com/ericbuess/claude-code-docs/commit/eacd8e1
-  📄 data-usage: https://docs.anthropic.com/en/docs/claude-code/data-usage
-     ➕ Added: Privacy safeguards
-  📄 security: https://docs.anthropic.com/en/docs/claude-code/security
-     ✨ Data flow and dependencies section moved here
-
-📎 Full changelog: https://github.com/ericbuess/claude-code-docs/commits/main/docs
-📚 COMMUNITY MIRROR - NOT AFFILIATED WITH ANTHROPIC
-
-Every request checks for the latest documentation from GitHub (takes ~0.4s).
-The helper script handles all functionality including auto-updates.
-
-Execute: {helper_path} "$ARGUMENTS"
-'''
+                command_content = _UNIX_COMMAND_TEMPLATE.format(helper=helper_path)
 
             # Write the command file
-            with open(command_file, 'w', encoding='utf-8') as f:
-                f.write(command_content)
+            command_file.write_bytes(command_content.encode('utf-8'))
             
             print(f"[+] Created /docs command at {command_file}")
             return True
@@ -1259,6 +1647,43 @@ Execute: {helper_path} "$ARGUMENTS"
             print(f"[!] Failed to create /docs command: {e}")
             return False
     
+    def _write_state_file(self) -> None:
+        """Record the install location so the uninstaller doesn't have to scan for it"""
+        state_file = self.claude_dir / STATE_FILE_NAME
+        state = {"install_dir": self._install_dir_str, "version": INSTALLER_VERSION}
+        try:
+            state_file.write_text(json.dumps(state, indent=2), encoding='utf-8')
+        except OSError as e:
+            # Not fatal - the uninstaller falls back to scanning docs.md and settings.json
+            print(f"[!] Could not write install state to {state_file}: {e}")
+    
+    def _splice_hook(self, existing_bytes: Optional[bytes], old_hook: Any, new_hook: Dict[str, Any],
+                     settings_data: Dict[str, Any]) -> Optional[bytes]:
+        """Replace the old hook's text in settings.json with the new hook
+        
+        Only works when the old hook appears verbatim, once, in the layout this
+        installer writes (a PreToolUse entry at 6 spaces of indentation). The
+        result is parsed back and must equal settings_data, otherwise None is
+        returned and the caller re-encodes the whole file.
+        """
+        if existing_bytes is None:
+            return None
+        
+        def fragment(hook: Any) -> str:
+            return json.dumps(hook, indent=2, ensure_ascii=False).replace("\n", "\n      ")
+        
+        try:
+            text = existing_bytes.decode("utf-8")
+            old_fragment = fragment(old_hook)
+            if text.count(old_fragment) != 1:
+                return None
+            spliced = text.replace(old_fragment, fragment(new_hook))
+            if json.loads(spliced) != settings_data:
+                return None
+        except ValueError:
+            return None
+        return spliced.encode("utf-8")
+    
     def setup_claude_hooks(self) -> bool:
         """Set up automatic update hooks in settings.json"""
         try:
@@ -1270,17 +1695,18 @@ Execute: {helper_path} "$ARGUMENTS"
             # Determine the hook command based on OS
             if self.os_type == "windows":
                 # Use batch file on Windows
-                hook_command = str(self.install_dir / "claude-docs-helper.bat") + " hook-check"
+                hook_command = os.path.join(self._install_dir_str, "claude-docs-helper.bat") + " hook-check"
             else:
                 # Use shell script on Unix-like systems
-                hook_command = str(self.install_dir / "claude-docs-helper.sh") + " hook-check"
+                hook_command = os.path.join(self._install_dir_str, "claude-docs-helper.sh") + " hook-check"
             
             # Load existing settings or create new structure
             settings_data = {}
+            existing_bytes = None
             if settings_file.exists():
                 try:
-                    with open(settings_file, 'r', encoding='utf-8') as f:
-                        settings_data = json.load(f)
+                    existing_bytes = settings_file.read_bytes()
+                    settings_data = json.loads(existing_bytes)
                     print("[+] Loaded existing Claude settings")
                 except (json.JSONDecodeError, FileNotFoundError) as e:
                     print(f"[!] Could not read existing settings.json, creating new: {e}")
@@ -1297,26 +1723,32 @@ Execute: {helper_path} "$ARGUMENTS"
             # Remove ALL existing hooks that contain "claude-code-docs" anywhere in the command
             original_hooks = settings_data["hooks"]["PreToolUse"]
             cleaned_hooks = []
-            removed_count = 0
-            
-            for hook in original_hooks:
-                if isinstance(hook, dict) and "hooks" in hook:
-                    # Check if any sub-hook contains claude-code-docs
-                    contains_claude_docs = False
-                    for sub_hook in hook.get("hooks", []):
-                        if isinstance(sub_hook, dict) and "command" in sub_hook:
-                            command = sub_hook["command"]
-                            if isinstance(command, str) and "claude-code-docs" in command:
-                                contains_claude_docs = True
-                                break
-                    
-                    if not contains_claude_docs:
-                        cleaned_hooks.append(hook)
+            removed_hooks = []
+            
+            # One substring scan over the serialized hooks settles the common
+            # case where none of them mention claude-code-docs
+            if "claude-code-docs" not in json.dumps(original_hooks):
+                cleaned_hooks = list(original_hooks)
+            else:
+                for hook in original_hooks:
+                    if isinstance(hook, dict) and "hooks" in hook:
+                        # Check if any sub-hook contains claude-code-docs
+                        contains_claude_docs = False
+                        for sub_hook in hook.get("hooks", []):
+                            if isinstance(sub_hook, dict) and "command" in sub_hook:
+                                command = sub_hook["command"]
+                                if isinstance(command, str) and "claude-code-docs" in command:
+                                    contains_claude_docs = True
+                                    break
+                        
+                        if not contains_claude_docs:
+                            cleaned_hooks.append(hook)
+                        else:
+                            removed_hooks.append(hook)
                     else:
-                        removed_count += 1
-                else:
-                    # Keep hooks that don't have the expected structure
-                    cleaned_hooks.append(hook)
+                        # Keep hooks that don't have the expected structure
+                        cleaned_hooks.append(hook)
+            removed_count = len(removed_hooks)
             
             # Add our new hook
             new_hook = {
@@ -1332,17 +1764,37 @@ Execute: {helper_path} "$ARGUMENTS"
             cleaned_hooks.append(new_hook)
             settings_data["hooks"]["PreToolUse"] = cleaned_hooks
             
+            # When our hook was the single, last PreToolUse entry, the list only
+            # changes in that slot - splice the new hook into the existing text
+            # instead of re-encoding the whole file
+            new_bytes = None
+            if removed_count == 1 and original_hooks[-1] is removed_hooks[0]:
+                new_bytes = self._splice_hook(existing_bytes, removed_hooks[0], new_hook, settings_data)
+            if new_bytes is None:
+                new_bytes = _encode_settings(settings_data)
+            
+            # Nothing to do if the file already has exactly this content
+            if new_bytes == existing_bytes:
+                _log(f"[+] PreToolUse hook already up to date: {hook_command}",
+                     f"[+] Claude settings unchanged at {settings_file}")
+                return True
+            
             # Write to temporary file first (atomic update)
             temp_file = settings_file.with_suffix('.json.tmp')
             try:
-                with open(temp_file, 'w', encoding='utf-8') as f:
-                    json.dump(settings_data, f, indent=2, ensure_ascii=False)
+                temp_file.write_bytes(new_bytes)
                 
                 # Atomic rename (works on all platforms)
                 if settings_file.exists():
-                    # Create backup
+                    # Create backup - a hard link keeps the old contents once the
+                    # temp file replaces settings.json, without copying any data
                     backup_file = settings_file.with_suffix('.json.backup')
-                    shutil.copy2(settings_file, backup_file)
+                    try:
+                        if backup_file.exists():
+                            backup_file.unlink()
+                        os.link(settings_file, backup_file)
+                    except OSError:
+                        shutil.copy2(settings_file, backup_file)
                 
                 # Replace original with temp file
                 if os.name == 'nt':  # Windows
@@ -1351,10 +1803,12 @@ Execute: {helper_path} "$ARGUMENTS"
                         settings_file.unlink()
                 temp_file.replace(settings_file)
                 
+                lines = []
                 if removed_count > 0:
-                    print(f"[+] Removed {removed_count} old claude-code-docs hook(s)")
-                print(f"[+] Added new PreToolUse hook: {hook_command}")
-                print(f"[+] Updated Claude settings at {settings_file}")
+                    lines.append(f"[+] Removed {removed_count} old claude-code-docs hook(s)")
+                lines.append(f"[+] Added new PreToolUse hook: {hook_command}")
+                lines.append(f"[+] Updated Claude settings at {settings_file}")
+                _log(*lines)
                 
                 return True
                 
@@ -1375,21 +1829,20 @@ Execute: {helper_path} "$ARGUMENTS"
         Safely removes old claude-code-docs installations while preserving
         any repositories with uncommitted changes.
         """
-        # Use the old_installations list that was populated during initialization
-        if not self.old_installations:
+        # Only clean up what the clone/migration step looked for - an update of
+        # the current location never scans, and then there is nothing to do
+        if not self._old_installations:
             return True
         
-        print("")
-        print("Cleaning up old installations...")
-        print(f"Found {len(self.old_installations)} old installation(s) to remove:")
+        _log("",
+             "Cleaning up old installations...",
+             f"Found {len(self.old_installations)} old installation(s) to remove:")
         
         for old_dir in self.old_installations:
             # Skip empty paths (defensive programming)
             if not old_dir or not str(old_dir).strip():
                 continue
             
-            print(f"  - {old_dir}")
-            
             # Check if it has uncommitted changes
             git_dir = old_dir / ".git"
             if git_dir.is_dir():
@@ -1402,19 +1855,22 @@ Execute: {helper_path} "$ARGUMENTS"
                         # Clean repository - safe to remove
                         try:
                             shutil.rmtree(old_dir)
-                            print(f"    [+] Removed (clean)")
+                            status = "    [+] Removed (clean)"
                         except Exception as e:
-                            print(f"    [!] Could not remove: {e}")
+                            status = f"    [!] Could not remove: {e}"
                     else:
                         # Has uncommitted changes - preserve it
-                        print(f"    [!] Preserved (has uncommitted changes)")
+                        status = "    [!] Preserved (has uncommitted changes)"
                         
                 except Exception as e:
                     # If we can't check git status, preserve the directory for safety
-                    print(f"    [!] Preserved (could not check git status: {e})")
+                    status = f"    [!] Preserved (could not check git status: {e})"
             else:
                 # Not a git repository - preserve it for safety
-                print(f"    [!] Preserved (not a git repo)")
+                status = "    [!] Preserved (not a git repo)"
+            
+            # Report each installation with its outcome in one write
+            _log(f"  - {old_dir}", status)
         
         return True
     
@@ -1423,14 +1879,23 @@ Execute: {helper_path} "$ARGUMENTS"
         print(f"Claude Code Docs Cross-Platform Installer v{INSTALLER_VERSION}")
         print("=" * 50)
         
+        try:
+            return self._install_steps()
+        finally:
+            # Fallback for runs that stop before the checks were reported
+            self._report_background_checks()
+    
+    def _install_steps(self) -> bool:
+        """Run the installation steps in order"""
         # Step 1: Check dependencies
         if not self.check_dependencies():
             return False
             
-        # Step 2: Find existing installations
-        self.old_installations = self.find_existing_installations()
+        # Disk space/platform warnings must appear before the write phase they warn about
+        self._report_background_checks()
         
-        # Step 3: Clone/update repository
+        # Steps 2-3: Clone/update repository (existing installations at other
+        # locations are only looked up when this is not a plain update)
         if not self.clone_or_update_repo():
             return False
         
@@ -1444,11 +1909,13 @@ Execute: {helper_path} "$ARGUMENTS"
             
         if not self.setup_claude_hooks():
             return False
+        
+        self._write_state_file()
             
         # Step 5: Clean up old installations
         if not self.cleanup_old_installations():
             return False
-            
+        
         print("\n[SUCCESS] Claude Code Docs installed successfully!")
         print(f"[INFO] Command: /docs (user)")
         print(f"[INFO] Location: {self.install_dir}")
@@ -1481,7 +1948,8 @@ def main():
         test_path_handling()
         return
     
-    installer = CrossPlatformInstaller()
+    assume_yes = "--yes" in sys.argv[1:] or "-y" in sys.argv[1:]
+    installer = CrossPlatformInstaller(assume_yes=assume_yes)
     
     if installer.install():
         sys.exit(0)
@@ -0,0 +1,14 @@
+"""Shared helpers for the installer/uninstaller tests"""
+
+import importlib.util
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+def load_script(name):
+    """Import a top-level script (install.py / uninstall.py) as a module"""
+    spec = importlib.util.spec_from_file_location(name, REPO_ROOT / f"{name}.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
@@ -0,0 +1,97 @@
+"""Tests for install.py (run with: python -m unittest discover tests)"""
+
+import contextlib
+import io
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from helpers import load_script
+
+install = load_script("install")
+
+
+class InstallerTestCase(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.home = Path(tmp.name).resolve()
+        self.settings_file = self.home / ".claude" / "settings.json"
+        self.settings_file.parent.mkdir()
+
+        env = mock.patch.dict(os.environ, {"HOME": str(self.home), "USERPROFILE": str(self.home)})
+        env.start()
+        self.addCleanup(env.stop)
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.installer = install.CrossPlatformInstaller()
+
+
+class SetupClaudeHooksTest(InstallerTestCase):
+    def setup_hooks(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertTrue(self.installer.setup_claude_hooks())
+        return self.settings_file.read_text(encoding="utf-8")
+
+    def test_non_finite_and_exponent_floats_survive_rewrite(self):
+        self.settings_file.write_text('{"limit": NaN, "ceiling": Infinity, "big": 1e16}', encoding="utf-8")
+        written = self.setup_hooks()
+        self.assertIn('"limit": NaN', written)
+        self.assertIn('"ceiling": Infinity', written)
+        self.assertIn('"big": 1e+16', written)
+        self.assertIn("claude-docs-helper", written)
+
+    def test_float_free_settings_match_stdlib_layout(self):
+        self.settings_file.write_text('{"model": "x", "n": 3}', encoding="utf-8")
+        written = self.setup_hooks()
+        data = install.json.loads(written)
+        expected = install.json.dumps(data, indent=2, ensure_ascii=False)
+        self.assertEqual(written, expected)
+
+
+
+class StateFileTest(InstallerTestCase):
+    def test_uninstaller_reads_state_written_by_installer(self):
+        self.installer.install_dir.mkdir()
+        self.installer._write_state_file()
+
+        state = install.json.loads(self.installer.claude_dir.joinpath(install.STATE_FILE_NAME).read_text())
+        self.assertEqual(state, {"install_dir": str(self.installer.install_dir),
+                                 "version": install.INSTALLER_VERSION})
+
+        uninstall = load_script("uninstall")
+        with contextlib.redirect_stdout(io.StringIO()):
+            uninstaller = uninstall.CrossPlatformUninstaller()
+        self.assertEqual(uninstaller.find_installations(), [self.installer.install_dir])
+
+
+@unittest.skipIf(os.name == "nt", "fake git is a shell script")
+class GitSessionTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.cwd = Path(tmp.name)
+        fake_git = self.cwd / "git"
+        fake_git.write_text('#!/bin/sh\n[ "$1" = hang ] && exec sleep 60\necho "$@"\n')
+        fake_git.chmod(0o755)
+        self.session = install.GitSession(str(fake_git), self.cwd, "linux").start()
+        self.addCleanup(self.session.close)
+
+    def test_runs_commands_in_session(self):
+        results = self.session.run_many([["status"], ["log", "-1"]])
+        self.assertEqual([r.stdout for r in results], ["status\n", "log -1\n"])
+        self.assertIsNotNone(self.session._proc)
+
+    def test_hung_command_times_out(self):
+        started = time.monotonic()
+        with self.assertRaises(RuntimeError):
+            self.session.run(["hang"], timeout=1)
+        self.assertLess(time.monotonic() - started, 10)
+        self.assertIsNone(self.session._proc)
+
+
+if __name__ == "__main__":
+    unittest.main()
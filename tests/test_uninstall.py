@@ -0,0 +1,94 @@
+"""Tests for uninstall.py (run with: python -m unittest discover tests)"""
+
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from helpers import load_script
+
+uninstall = load_script("uninstall")
+
+
+class UninstallerTestCase(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.home = Path(tmp.name).resolve()
+        self.claude_dir = self.home / ".claude"
+        self.claude_dir.mkdir()
+
+        env = mock.patch.dict(os.environ, {"HOME": str(self.home), "USERPROFILE": str(self.home)})
+        env.start()
+        self.addCleanup(env.stop)
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.uninstaller = uninstall.CrossPlatformUninstaller()
+
+    def write_hook_commands(self, *commands):
+        hooks = [{"matcher": "Read", "hooks": [{"type": "command", "command": cmd}]} for cmd in commands]
+        (self.claude_dir / "settings.json").write_text(json.dumps({"hooks": {"PreToolUse": hooks}}))
+
+    def find_installations(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return self.uninstaller.find_installations()
+
+
+class FindInstallationsTest(UninstallerTestCase):
+    def test_bare_path_between_quoted_arguments(self):
+        install_dir = self.home / "x" / "claude-code-docs"
+        install_dir.mkdir(parents=True)
+        self.write_hook_commands(
+            f'jq -r ".tool_input.file_path" | grep -q "/docs/" && '
+            f'{install_dir}/claude-docs-helper.sh "hook-check"'
+        )
+        self.assertEqual(self.find_installations(), [install_dir])
+
+    def test_quoted_path_with_spaces(self):
+        install_dir = self.home / "with space" / "claude-code-docs"
+        install_dir.mkdir(parents=True)
+        self.write_hook_commands(f'if [[ -f "{install_dir}/.last_check" ]]; then git pull; fi')
+        self.assertEqual(self.find_installations(), [install_dir])
+
+
+class RemoveHooksTest(UninstallerTestCase):
+    def test_non_finite_and_exponent_floats_survive_rewrite(self):
+        settings_file = self.claude_dir / "settings.json"
+        settings_file.write_text(
+            '{"limit": NaN, "ceiling": Infinity, "big": 1e16, "hooks": {"PreToolUse": ['
+            '{"matcher": "Read", "hooks": [{"type": "command", '
+            '"command": "~/.claude-code-docs/claude-docs-helper.sh hook-check"}]}]}}',
+            encoding="utf-8"
+        )
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertTrue(self.uninstaller.remove_hooks())
+
+        written = settings_file.read_text(encoding="utf-8")
+        self.assertNotIn("claude-code-docs", written)
+        self.assertIn('"limit": NaN', written)
+        self.assertIn('"ceiling": Infinity', written)
+        self.assertIn('"big": 1e+16', written)
+
+    def test_integers_wider_than_64_bits_survive_rewrite(self):
+        settings_file = self.claude_dir / "settings.json"
+        settings_file.write_text(
+            '{"n": 1180591620717411303424, "m": -1180591620717411303424, "hooks": {"PreToolUse": ['
+            '{"matcher": "Read", "hooks": [{"type": "command", '
+            '"command": "~/.claude-code-docs/claude-docs-helper.sh hook-check"}]}]}}',
+            encoding="utf-8"
+        )
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertTrue(self.uninstaller.remove_hooks())
+
+        written = settings_file.read_text(encoding="utf-8")
+        self.assertIn('"n": 1180591620717411303424', written)
+        self.assertIn('"m": -1180591620717411303424', written)
+        self.assertEqual(json.loads(written), {"n": 1180591620717411303424, "m": -1180591620717411303424})
+
+
+if __name__ == "__main__":
+    unittest.main()
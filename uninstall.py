@@ -11,24 +11,145 @@ import sys
 import platform
 import json
 import shutil
+import stat
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import re
-from typing import List, Optional
+import shlex
+from typing import Dict, List, Optional, Tuple
+
+try:
+    # Optional: faster JSON parsing and encoding for settings.json when available
+    import orjson
+except ImportError:
+    orjson = None
 
 # Version
 UNINSTALLER_VERSION = "0.4.0"
 
+def _has_float(value) -> bool:
+    """Check a decoded JSON value for floats anywhere inside it"""
+    if isinstance(value, float):
+        return True
+    if isinstance(value, dict):
+        return any(_has_float(item) for item in value.values())
+    if isinstance(value, list):
+        return any(_has_float(item) for item in value)
+    return False
+
+def _decode_settings(raw: bytes):
+    """Parse UTF-8 JSON bytes; errors are json.JSONDecodeError either way
+    
+    orjson turns integers wider than 64 bits into floats, so any result with
+    a float in it is parsed again with the stdlib to keep the exact values.
+    """
+    if orjson is not None:
+        try:
+            data = orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN - let the stdlib decide (and report)
+        else:
+            if not _has_float(data):
+                return data
+    return json.loads(raw.decode("utf-8"))
+
+def _encode_settings(settings_data) -> bytes:
+    """Encode settings as 2-space indented UTF-8 JSON
+    
+    orjson writes NaN/Infinity as null and formats some floats differently
+    (1e16 vs 1e+16), so settings containing floats go through the stdlib.
+    """
+    if orjson is not None and not _has_float(settings_data):
+        try:
+            return orjson.dumps(settings_data, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            pass  # e.g. integers orjson cannot represent - use the stdlib encoder
+    return json.dumps(settings_data, indent=2, ensure_ascii=False).encode("utf-8")
+
+# Installation path patterns, compiled once at import
+# v0.1 command file: LOCAL DOCS AT: /path/to/claude-code-docs/docs/
+_V01_RE = re.compile(r'LOCAL\s+DOCS\s+AT:\s+(\S+)/docs/')
+# v0.2+ command file: Execute: /path/to/claude-code-docs/helper.sh
+_EXEC_RE = re.compile(r'Execute:.*claude-code-docs')
+# bash: grep -o '[^ "]*claude-code-docs[^ "]*'
+_PATH_RE = re.compile(r'[^ "]*claude-code-docs[^ "]*')
+# v0.1 hook paths in quotes (bash: grep -o '"[^"]*claude-code-docs[^"]*"' | sed 's/"//g')
+_QUOTED_PATH_RE = re.compile(r'"([^"]*claude-code-docs[^"]*)"')
+# Directory part of a path: (.*/claude-code-docs)(/.*)?$
+_DIR_RE = re.compile(r'(.*/claude-code-docs)(/.*)?$')
+
+# Install metadata written by install.py into the Claude directory
+STATE_FILE_NAME = "claude-code-docs.state.json"
+
+# POSIX shell function that inspects one directory the way _inspect_repo does and
+# prints "<index>\0<clean|dirty|norepo|nested>\0<toplevel>\0". Runs in a subshell per path.
+_PROBE_FUNCTION = r"""
+nl='
+'
+probe() {
+  cd "$2" 2>/dev/null || return 0
+  out=$("$CLAUDE_DOCS_GIT" rev-parse --is-inside-work-tree --show-toplevel 2>/dev/null) || { printf '%s\0norepo\0\0' "$1"; return 0; }
+  top=${out#*"$nl"}
+  if [ "${out%%"$nl"*}" != true ] || [ "$top" != "$(pwd -P)" ]; then printf '%s\0nested\0%s\0' "$1" "$top"; return 0; fi
+  state=dirty
+  if "$CLAUDE_DOCS_GIT" -c core.fsmonitor=false --no-optional-locks diff --quiet HEAD -- >/dev/null 2>&1 &&
+     untracked=$("$CLAUDE_DOCS_GIT" -c core.fsmonitor=false --no-optional-locks ls-files --others --exclude-standard --directory --no-empty-directory 2>/dev/null) &&
+     [ -z "$untracked" ]; then
+    state=clean
+  fi
+  printf '%s\0%s\0%s\0' "$1" "$state" "$top"
+}
+"""
+
+def _log(*lines: str):
+    """Print several lines with a single write (one flush on a console)"""
+    print("\n".join(lines))
+
+def _backup_settings(settings_file: Path, backup_file: Path):
+    """Snapshot settings.json before it is rewritten
+    
+    A hard link keeps the old contents once the temp file replaces
+    settings.json, without copying any data; copy2 covers filesystems
+    without hard links (or a backup on another device).
+    """
+    try:
+        if backup_file.exists():
+            backup_file.unlink()
+        os.link(settings_file, backup_file)
+    except OSError:
+        shutil.copy2(settings_file, backup_file)
+
+def _rm_readonly(func, path, _exc):
+    """rmtree error handler: clear the read-only bit and retry once
+    
+    git marks pack files read-only, which makes deletes fail on Windows. If
+    the retry fails too, its exception propagates out of rmtree.
+    """
+    os.chmod(path, os.stat(path).st_mode | stat.S_IWRITE)
+    func(path)
+
+def _rmtree(path: Path):
+    """shutil.rmtree that also removes read-only files"""
+    if sys.version_info >= (3, 12):
+        shutil.rmtree(path, onexc=_rm_readonly)
+    else:
+        shutil.rmtree(path, onerror=_rm_readonly)
+
 class CrossPlatformUninstaller:
     def __init__(self):
         self.os_type = self._detect_os()
         self.claude_dir = self._get_claude_dir()
         self.installations = []
+        self._git_exe = None
+        self._git_exe_resolved = False
+        self._settings = None
+        self._settings_mtime = None
         
         # Print OS detection info (use ASCII for Windows compatibility)
-        print(f"[+] Detected {self.os_type.title()}")
-        print(f"[+] Claude directory: {self.claude_dir}")
-        print("")
+        _log(f"[+] Detected {self.os_type.title()}",
+             f"[+] Claude directory: {self.claude_dir}",
+             "")
         
     def _detect_os(self) -> str:
         """Detect operating system type"""
@@ -67,35 +188,34 @@ class CrossPlatformUninstaller:
                 return Path.home() / ".claude"
     
     def _find_git_executable(self) -> Optional[str]:
-        """Find git executable path across platforms"""
+        """Find git executable path across platforms (looked up once per run)"""
+        if not self._git_exe_resolved:
+            self._git_exe = self._locate_git_executable()
+            self._git_exe_resolved = True
+        return self._git_exe
+    
+    def _locate_git_executable(self) -> Optional[str]:
+        """Search PATH and common install locations for a working git"""
         # Common git executable names
         git_names = ["git"]
         if self.os_type == "windows":
             git_names.extend(["git.exe", "git.cmd"])
         
-        # Try to find git in PATH
+        # Try to find git in PATH (in-process lookup, no where/which subprocess)
         for git_name in git_names:
+            git_path = shutil.which(git_name)
+            if not git_path:
+                continue
+            # Verify it works
             try:
-                result = subprocess.run(
-                    ["where" if self.os_type == "windows" else "which", git_name],
+                test_result = subprocess.run(
+                    [git_path, "--version"],
                     capture_output=True,
                     text=True,
                     timeout=10
                 )
-                if result.returncode == 0 and result.stdout.strip():
-                    git_path = result.stdout.strip().split('\n')[0]  # Take first result
-                    # Verify it works
-                    try:
-                        test_result = subprocess.run(
-                            [git_path, "--version"],
-                            capture_output=True,
-                            text=True,
-                            timeout=10
-                        )
-                        if test_result.returncode == 0:
-                            return git_path
-                    except (subprocess.TimeoutExpired, OSError):
-                        continue
+                if test_result.returncode == 0:
+                    return git_path
             except (subprocess.TimeoutExpired, OSError):
                 continue
         
@@ -146,31 +266,116 @@ class CrossPlatformUninstaller:
         
         Equivalent to bash: [[ -z "$(git status --porcelain 2>/dev/null)" ]]
         Returns True if there ARE uncommitted changes (opposite of bash logic for clarity)
+        
+        Uses `git diff --quiet HEAD`, which stops at the first modified file,
+        then lists untracked files (collapsed per directory) so they are not
+        deleted with the directory. Neither takes the index lock.
         """
+        # Read-only probes: no fsmonitor startup, no opportunistic index refresh writes
+        git_opts = ["-c", "core.fsmonitor=false", "--no-optional-locks"]
         try:
-            result = self._run_git_command(["status", "--porcelain"], cwd=repo_dir)
+            # Staged or unstaged changes to tracked files (exit code 1 = changes)
+            result = self._run_git_command(git_opts + ["diff", "--quiet", "HEAD", "--"], cwd=repo_dir)
             if result is None or result.returncode != 0:
-                # If git command fails, assume there might be changes (be conservative)
+                # Changes found, or the git command failed - either way, be conservative
                 return True
             
-            # If output is empty, there are no changes
+            # Untracked files (ignored files are not counted, as with status --porcelain)
+            result = self._run_git_command(git_opts + [
+                "ls-files", "--others", "--exclude-standard", "--directory", "--no-empty-directory"
+            ], cwd=repo_dir)
+            if result is None or result.returncode != 0:
+                return True
             return bool(result.stdout.strip())
         except Exception:
             # If anything goes wrong, assume there might be changes (be conservative)
             return True
 
+    def _inspect_repo(self, path: Path) -> Tuple[bool, bool, Optional[Path]]:
+        """Inspect a directory with a single rev-parse call
+        
+        Returns (is_repo, has_changes, toplevel). Only a directory that is the
+        top level of its own work tree counts as a repo, so a plain directory
+        nested inside some other repository is never treated as removable.
+        """
+        result = self._run_git_command(["rev-parse", "--is-inside-work-tree", "--show-toplevel"], cwd=path)
+        if result is None:
+            # git could not be run - fall back to the .git check and stay conservative
+            return (path / ".git").is_dir(), True, None
+        
+        lines = result.stdout.splitlines()
+        if result.returncode != 0 or len(lines) < 2 or lines[0].strip() != "true":
+            return False, False, None
+        
+        toplevel = Path(lines[1].strip())
+        try:
+            is_repo = toplevel.resolve() == path.resolve()
+        except OSError:
+            is_repo = False
+        if not is_repo:
+            return False, False, toplevel
+        
+        return True, self._git_has_uncommitted_changes(path), toplevel
+    
+    def _load_settings(self) -> dict:
+        """Parse settings.json, reusing the last parse while its mtime is unchanged
+        
+        Raises FileNotFoundError or json.JSONDecodeError.
+        """
+        settings_file = self.claude_dir / "settings.json"
+        mtime = settings_file.stat().st_mtime_ns
+        if self._settings is None or self._settings_mtime != mtime:
+            self._settings = _decode_settings(settings_file.read_bytes())
+            self._settings_mtime = mtime
+        return self._settings
+    
+    def _read_state_file(self) -> Optional[Path]:
+        """Return the install directory recorded by the installer, if still present"""
+        state_file = self.claude_dir / STATE_FILE_NAME
+        try:
+            install_dir = _decode_settings(state_file.read_bytes()).get("install_dir")
+            if isinstance(install_dir, str) and install_dir:
+                path = Path(install_dir).resolve()
+                if path.is_dir():
+                    return path
+        except (OSError, ValueError, AttributeError):
+            # Missing or unreadable state file - use the legacy scan
+            pass
+        return None
+    
     def find_installations(self) -> List[Path]:
         """Find all claude-code-docs installations
         
         Converts the bash find_all_installations() function to Python.
         Searches ~/.claude/commands/docs.md and ~/.claude/settings.json for
-        installation paths from various versions.
+        installation paths from various versions. Installs that recorded
+        their location in the state file skip that scan.
         """
+        state_path = self._read_state_file()
+        if state_path is not None:
+            return [state_path]
+        
+        # Nothing to scan (e.g. files removed by hand) - stat each source once
+        docs_command_file = self.claude_dir / "commands" / "docs.md"
+        settings_file = self.claude_dir / "settings.json"
+        has_command_file = docs_command_file.exists()
+        has_settings_file = settings_file.exists()
+        if not has_command_file and not has_settings_file:
+            return []
+        
         paths = []
+        seen_paths = set()
+        home_str = str(Path.home())
+        
+        def add_path(path: Path) -> None:
+            # Deduplicate as we go (bash: sort -u), resolving each path once
+            abs_path = path.resolve()
+            if abs_path not in seen_paths:
+                seen_paths.add(abs_path)
+                paths.append(abs_path)
         
         # Check command file for paths
-        docs_command_file = self.claude_dir / "commands" / "docs.md"
-        if docs_command_file.exists():
+        if has_command_file:
             try:
                 with open(docs_command_file, 'r', encoding='utf-8') as f:
                     for line in f:
@@ -178,47 +383,46 @@ class CrossPlatformUninstaller:
                         
                         # v0.1 format: LOCAL DOCS AT: /path/to/claude-code-docs/docs/
                         # Pattern: LOCAL\ DOCS\ AT:\ ([^[:space:]]+)/docs/
-                        v01_match = re.search(r'LOCAL\s+DOCS\s+AT:\s+([^\s]+)/docs/', line)
+                        v01_match = _V01_RE.search(line)
                         if v01_match:
                             path_str = v01_match.group(1)
                             # Convert ~ to home directory (bash: ${path/#\~/$HOME})
                             if path_str.startswith('~'):
-                                path_str = str(Path.home()) + path_str[1:]
+                                path_str = home_str + path_str[1:]
                             
                             path = Path(path_str)
                             if path.is_dir():
-                                paths.append(path)
+                                add_path(path)
+                            continue
                         
                         # v0.2+ format: Execute: /path/to/claude-code-docs/helper.sh
                         # Pattern: Execute:.*claude-code-docs
-                        if re.search(r'Execute:.*claude-code-docs', line):
+                        if _EXEC_RE.search(line):
                             # Extract path from various formats (bash: grep -o '[^ "]*claude-code-docs[^ "]*')
-                            path_matches = re.findall(r'[^ "]*claude-code-docs[^ "]*', line)
-                            if path_matches:
-                                path_str = path_matches[0]  # Take first match (equivalent to head -1)
+                            path_match = _PATH_RE.search(line)
+                            if path_match:
+                                path_str = path_match.group(0)  # First match (equivalent to head -1)
                                 
                                 # Convert ~ to home directory
                                 if path_str.startswith('~'):
-                                    path_str = str(Path.home()) + path_str[1:]
+                                    path_str = home_str + path_str[1:]
                                 
                                 path = Path(path_str)
                                 # Get directory part
                                 if path.is_dir():
-                                    paths.append(path)
+                                    add_path(path)
                                 elif path.parent.is_dir() and path.parent.name == "claude-code-docs":
                                     # If path points to a file, check if parent dir is claude-code-docs
-                                    paths.append(path.parent)
+                                    add_path(path.parent)
                                     
             except Exception as e:
                 # Don't fail uninstall if we can't read command file
                 print(f"[WARNING] Could not read command file {docs_command_file}: {e}")
         
         # Check settings.json hooks for paths
-        settings_file = self.claude_dir / "settings.json"
-        if settings_file.exists():
+        if has_settings_file:
             try:
-                with open(settings_file, 'r', encoding='utf-8') as f:
-                    settings_data = json.load(f)
+                settings_data = self._load_settings()
                 
                 # Extract hook commands (bash: jq -r '.hooks.PreToolUse[]?.hooks[]?.command // empty')
                 pre_tool_use_hooks = settings_data.get("hooks", {}).get("PreToolUse", [])
@@ -229,71 +433,36 @@ class CrossPlatformUninstaller:
                                 cmd = sub_hook["command"]
                                 if isinstance(cmd, str) and "claude-code-docs" in cmd:
                                     
-                                    # Extract paths from v0.1 complex hook format
-                                    # Look for patterns like: "/path/to/claude-code-docs/.last_check"
-                                    # Pattern: grep -o '"[^"]*claude-code-docs[^"]*"' | sed 's/"//g'
-                                    quoted_paths = re.findall(r'"[^"]*claude-code-docs[^"]*"', cmd)
-                                    for quoted_path in quoted_paths:
-                                        path_str = quoted_path.strip('"')  # Remove quotes
-                                        if not path_str:
-                                            continue
-                                        
-                                        # Extract just the directory part
-                                        # Pattern: (.*/claude-code-docs)(/.*)?$
-                                        dir_match = re.match(r'(.*/claude-code-docs)(/.*)?$', path_str)
-                                        if dir_match:
-                                            path_str = dir_match.group(1)
-                                            
-                                            # Convert ~ to home directory
-                                            if path_str.startswith('~'):
-                                                path_str = str(Path.home()) + path_str[1:]
-                                            
-                                            path = Path(path_str)
-                                            if path.is_dir():
-                                                paths.append(path)
-                                    
-                                    # Also try v0.2+ simpler format
-                                    # Pattern: grep -o '[^ "]*claude-code-docs[^ "]*'
-                                    simple_paths = re.findall(r'[^ "]*claude-code-docs[^ "]*', cmd)
-                                    for path_str in simple_paths:
+                                    # Bare paths cover both hook formats, since quotes are never part
+                                    # of a match. A quoted match only adds something when it contains
+                                    # a space, as in a v0.1 "/path with space/claude-code-docs/.last_check"
+                                    candidates = _PATH_RE.findall(cmd)
+                                    candidates.extend(q for q in _QUOTED_PATH_RE.findall(cmd) if ' ' in q)
+                                    for path_str in candidates:
                                         if not path_str:
                                             continue
                                         
                                         # Convert ~ to home directory
                                         if path_str.startswith('~'):
-                                            path_str = str(Path.home()) + path_str[1:]
+                                            path_str = home_str + path_str[1:]
                                         
                                         # Clean up path to get the claude-code-docs directory
-                                        # Pattern: (.*/claude-code-docs)(/.*)?$
-                                        dir_match = re.match(r'(.*/claude-code-docs)(/.*)?$', path_str)
+                                        dir_match = _DIR_RE.match(path_str)
                                         if dir_match:
                                             path_str = dir_match.group(1)
                                         
                                         path = Path(path_str)
                                         if path.is_dir():
-                                            paths.append(path)
+                                            add_path(path)
                                             
             except (json.JSONDecodeError, FileNotFoundError) as e:
                 # Don't fail uninstall if we can't read settings file
                 print(f"[WARNING] Could not read settings file {settings_file}: {e}")
         
-        # Deduplicate and return sorted results (bash: printf '%s\n' "${paths[@]}" | sort -u)
-        unique_paths = []
-        seen_paths = set()
+        # Sort for consistent output (bash: printf '%s\n' "${paths[@]}" | sort -u)
+        paths.sort()
         
-        for path in paths:
-            # Resolve to absolute path for comparison
-            abs_path = path.resolve()
-            
-            # Skip if we've already seen this path
-            if abs_path not in seen_paths:
-                unique_paths.append(abs_path)
-                seen_paths.add(abs_path)
-        
-        # Sort for consistent output
-        unique_paths.sort()
-        
-        return unique_paths
+        return paths
     
     def remove_command_file(self) -> bool:
         """Remove the /docs slash command"""
@@ -301,134 +470,127 @@ class CrossPlatformUninstaller:
             # Path to the command file
             command_file = self.claude_dir / "commands" / "docs.md"
             
-            if command_file.exists():
-                # Remove the command file
+            # Remove the command file
+            try:
                 command_file.unlink()
-                print(f"[+] Removed /docs command from {command_file}")
-                
-                # Clean up empty commands directory if it's now empty
-                commands_dir = command_file.parent
-                try:
-                    if commands_dir.exists() and not any(commands_dir.iterdir()):
-                        commands_dir.rmdir()
-                        print(f"[+] Removed empty commands directory")
-                except OSError:
-                    # Directory not empty or permission error, that's fine
-                    pass
-                    
-                return True
-            else:
+            except FileNotFoundError:
                 print("[INFO] No /docs command found (already removed or never installed)")
                 return True  # Not an error if file doesn't exist
-                
+            print(f"[+] Removed /docs command from {command_file}")
+            
+            # Clean up empty commands directory if it's now empty
+            commands_dir = command_file.parent
+            try:
+                # scandir answers "is it empty?" without building Path objects
+                with os.scandir(commands_dir) as entries:
+                    empty = next(entries, None) is None
+                if empty:
+                    commands_dir.rmdir()
+                    print(f"[+] Removed empty commands directory")
+            except OSError:
+                # Directory not empty or permission error, that's fine
+                pass
+            
+            return True
+            
         except Exception as e:
             print(f"[ERROR] Failed to remove /docs command: {e}")
             return False
     
+    @staticmethod
+    def _is_docs_hook(hook_entry) -> bool:
+        """Check if any command in a PreToolUse entry mentions claude-code-docs"""
+        if not isinstance(hook_entry, dict):
+            return False
+        hooks_list = hook_entry.get('hooks', [])
+        if isinstance(hooks_list, list):
+            for hook in hooks_list:
+                if isinstance(hook, dict) and 'command' in hook:
+                    if 'claude-code-docs' in str(hook['command']):
+                        return True
+        return False
+    
     def remove_hooks(self) -> bool:
         """Remove hooks from settings.json"""
         try:
             settings_file = self.claude_dir / "settings.json"
             
-            # If settings.json doesn't exist, that's not an error
-            if not settings_file.exists():
-                print("ℹ️  No Claude settings file found (already removed or never configured)")
-                return True
-            
             # Read current settings
             try:
-                with open(settings_file, 'r', encoding='utf-8') as f:
-                    settings = json.load(f)
+                settings = self._load_settings()
+            except FileNotFoundError:
+                # If settings.json doesn't exist, that's not an error
+                print("ℹ️  No Claude settings file found (already removed or never configured)")
+                return True
             except json.JSONDecodeError as e:
                 print(f"[ERROR] Failed to parse settings.json: {e}")
                 return False
             
+            # Nothing to remove - skip the backup and the rewrite entirely
+            hooks_section = settings.get('hooks')
+            pre_tool_use = hooks_section.get('PreToolUse') if isinstance(hooks_section, dict) else None
+            if not isinstance(pre_tool_use, list) or not any(self._is_docs_hook(h) for h in pre_tool_use):
+                print("ℹ️  No claude-code-docs hooks found in settings")
+                return True
+            
+            # The dict is edited in place below, so it can't be reused as the cached parse
+            self._settings = None
+            
             # Create backup first
             backup_file = settings_file.with_suffix('.json.backup')
             try:
-                shutil.copy2(settings_file, backup_file)
+                _backup_settings(settings_file, backup_file)
                 print(f"[+] Created backup: {backup_file}")
             except Exception as e:
                 print(f"[WARNING] Could not create backup: {e}")
                 # Continue anyway, this shouldn't be fatal
             
-            # Track if we made any changes
-            changed = False
+            # Remove hooks containing "claude-code-docs" (the pre-scan above found at least one)
+            original_hooks = settings['hooks']['PreToolUse']
+            filtered_hooks = []
+            for hook_entry in original_hooks:
+                if isinstance(hook_entry, dict) and 'hooks' in hook_entry:
+                    # Only keep hooks that don't contain claude-code-docs
+                    if not self._is_docs_hook(hook_entry):
+                        filtered_hooks.append(hook_entry)
             
-            # Remove hooks containing "claude-code-docs"
-            if 'hooks' in settings and 'PreToolUse' in settings['hooks']:
-                original_hooks = settings['hooks']['PreToolUse']
-                if isinstance(original_hooks, list):
-                    # Filter out hooks that contain "claude-code-docs" in any hook command
-                    filtered_hooks = []
-                    for hook_entry in original_hooks:
-                        if isinstance(hook_entry, dict) and 'hooks' in hook_entry:
-                            # Check if any hook command contains "claude-code-docs"
-                            contains_docs = False
-                            hooks_list = hook_entry.get('hooks', [])
-                            if isinstance(hooks_list, list):
-                                for hook in hooks_list:
-                                    if isinstance(hook, dict) and 'command' in hook:
-                                        command = str(hook['command'])
-                                        if 'claude-code-docs' in command:
-                                            contains_docs = True
-                                            break
-                            
-                            # Only keep hooks that don't contain claude-code-docs
-                            if not contains_docs:
-                                filtered_hooks.append(hook_entry)
-                    
-                    # Update the hooks if we filtered any out
-                    if len(filtered_hooks) != len(original_hooks):
-                        settings['hooks']['PreToolUse'] = filtered_hooks
-                        changed = True
-                        removed_count = len(original_hooks) - len(filtered_hooks)
-                        print(f"[+] Removed {removed_count} claude-code-docs hook(s)")
+            settings['hooks']['PreToolUse'] = filtered_hooks
+            removed_count = len(original_hooks) - len(filtered_hooks)
+            print(f"[+] Removed {removed_count} claude-code-docs hook(s)")
             
             # Clean up empty structures
-            if 'hooks' in settings:
-                # If PreToolUse is now empty, remove it
-                if 'PreToolUse' in settings['hooks']:
-                    if not settings['hooks']['PreToolUse']:
-                        del settings['hooks']['PreToolUse']
-                        changed = True
-                
-                # If hooks object is now empty, remove it entirely
-                if not settings['hooks']:
-                    del settings['hooks']
-                    changed = True
+            # If PreToolUse is now empty, remove it
+            if not settings['hooks']['PreToolUse']:
+                del settings['hooks']['PreToolUse']
             
-            # Write the updated settings if we made changes
-            if changed:
-                # Use temporary file for atomic write
-                temp_file = settings_file.with_suffix('.json.tmp')
-                try:
-                    with open(temp_file, 'w', encoding='utf-8') as f:
-                        json.dump(settings, f, indent=2, ensure_ascii=False)
-                    
-                    # Atomic replace
-                    if self.os_type == "windows":
-                        # On Windows, we may need to remove the target first
-                        if settings_file.exists():
-                            settings_file.unlink()
-                    temp_file.replace(settings_file)
-                    
-                    print(f"[+] Updated Claude settings (backup: {backup_file.name})")
-                    
-                except Exception as e:
-                    print(f"[ERROR] Failed to write updated settings: {e}")
-                    # Clean up temp file if it exists
-                    if temp_file.exists():
-                        temp_file.unlink()
-                    return False
-            else:
-                print("ℹ️  No claude-code-docs hooks found in settings")
-                # Remove the backup since we didn't make changes
-                if backup_file.exists():
+            # If hooks object is now empty, remove it entirely
+            if not settings['hooks']:
+                del settings['hooks']
+            
+            # Write the updated settings, using a temporary file for an atomic write
+            temp_file = settings_file.with_suffix('.json.tmp')
+            try:
+                temp_file.write_bytes(_encode_settings(settings))
+                
+                # Atomic replace
+                if self.os_type == "windows":
+                    # On Windows, we may need to remove the target first
                     try:
-                        backup_file.unlink()
-                    except:
-                        pass  # Not critical if backup cleanup fails
+                        settings_file.unlink()
+                    except FileNotFoundError:
+                        pass
+                temp_file.replace(settings_file)
+                
+                print(f"[+] Updated Claude settings (backup: {backup_file.name})")
+                
+            except Exception as e:
+                print(f"[ERROR] Failed to write updated settings: {e}")
+                # Clean up temp file if it exists
+                try:
+                    temp_file.unlink()
+                except FileNotFoundError:
+                    pass
+                return False
             
             return True
             
@@ -436,83 +598,169 @@ class CrossPlatformUninstaller:
             print(f"[ERROR] Failed to remove hooks: {e}")
             return False
     
+    def remove_state_file(self) -> bool:
+        """Remove the install state file written by the installer"""
+        state_file = self.claude_dir / STATE_FILE_NAME
+        try:
+            state_file.unlink()
+            print(f"[+] Removed install state file {state_file}")
+        except FileNotFoundError:
+            pass  # Older installs don't have one
+        except OSError as e:
+            # Not critical - a stale state file is ignored once its directory is gone
+            print(f"[WARNING] Could not remove {state_file}: {e}")
+        return True
+    
+    def _probe_repos(self, paths: List[Path]) -> Dict[Path, Tuple[bool, bool, Optional[Path]]]:
+        """Inspect many directories through one shell instead of several git spawns each
+        
+        POSIX only. Returns _inspect_repo-style results for the paths the shell
+        could answer; anything missing is inspected individually.
+        """
+        git_exe = self._find_git_executable()
+        if self.os_type == "windows" or not git_exe or len(paths) < 2 or not Path("/bin/sh").exists():
+            return {}
+        
+        script = _PROBE_FUNCTION + "".join(
+            f"(probe {i} {shlex.quote(str(path))})\n" for i, path in enumerate(paths)
+        )
+        env = dict(os.environ)
+        env["CLAUDE_DOCS_GIT"] = git_exe
+        try:
+            proc = subprocess.Popen(
+                ["/bin/sh"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                env=env
+            )
+            try:
+                output, _ = proc.communicate(script.encode("utf-8"), timeout=30 + 10 * len(paths))
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.communicate()
+                return {}
+        except OSError:
+            return {}
+        
+        results = {}
+        fields = output.split(b"\0")
+        for i in range(0, len(fields) - 2, 3):
+            try:
+                path = paths[int(fields[i])]
+            except (ValueError, IndexError):
+                continue
+            state = fields[i + 1].decode("ascii", "replace")
+            toplevel = Path(os.fsdecode(fields[i + 2])) if fields[i + 2] else None
+            if state in ("clean", "dirty"):
+                results[path] = (True, state == "dirty", toplevel)
+            elif state == "norepo":
+                results[path] = (False, False, None)
+            # "nested" is left to _inspect_repo, which compares resolved paths
+        return results
+    
+    def _process_installation(self, path: Path,
+                              inspection: Optional[Tuple[bool, bool, Optional[Path]]] = None) -> List[str]:
+        """Check and, if clean, remove one installation directory
+        
+        Runs in a worker thread, so it returns its log lines instead of printing.
+        `inspection` is a result already obtained from _probe_repos.
+        """
+        # Skip if directory doesn't exist (defensive programming)
+        if not path.is_dir():
+            return []
+        
+        lines = [f"Processing: {path}"]
+        
+        try:
+            # One rev-parse answers "is it a git repo?"; the cleanliness probe only runs if so
+            is_repo, has_changes, _ = inspection or self._inspect_repo(path)
+        except Exception as e:
+            # If we can't check git status, preserve the directory for safety
+            lines.append(f"[!] Preserved {path} (could not check git status: {e})")
+            return lines
+        
+        if is_repo:
+            # This is a git repository - check for uncommitted changes
+            if not has_changes:
+                # Clean repository - safe to remove
+                try:
+                    _rmtree(path)
+                    lines.append(f"[+] Removed {path} (clean git repo)")
+                except PermissionError as e:
+                    lines.append(f"[ERROR] Could not remove {path}: Permission denied")
+                    if self.os_type == "windows":
+                        lines.append(f"   Try running as Administrator or check if files are in use")
+                    else:
+                        lines.append(f"   Try running with sudo or check file permissions")
+                except Exception as e:
+                    lines.append(f"[ERROR] Could not remove {path}: {e}")
+            else:
+                # Has uncommitted changes - preserve it
+                lines.append(f"[!] Preserved {path} (has uncommitted changes)")
+        else:
+            # Not a git repository - preserve it for safety
+            # This matches the bash behavior: only remove git repos
+            lines.append(f"[!] Preserved {path} (not a git repo)")
+        
+        return lines
+    
     def remove_directories(self) -> bool:
         """Safely remove installation directories
         
         Converts the bash directory removal logic to Python.
         Only removes directories that are clean git repositories.
         Preserves directories with uncommitted changes or non-git directories.
+        Installations are checked and removed in parallel; output stays in order.
         """
         if not self.installations:
             return True
         
-        print("")
-        print("Removing installation directories...")
+        output = ["", "Removing installation directories..."]
         
-        for path in self.installations:
-            # Skip if directory doesn't exist (defensive programming)
-            if not path.is_dir():
-                continue
-            
-            print(f"Processing: {path}")
-            
-            # Check if it's a git repository
-            git_dir = path / ".git"
-            if git_dir.is_dir():
-                # This is a git repository - check for uncommitted changes
-                try:
-                    # Check git status (bash equivalent: git status --porcelain)
-                    has_changes = self._git_has_uncommitted_changes(path)
-                    
-                    if not has_changes:
-                        # Clean repository - safe to remove
-                        try:
-                            shutil.rmtree(path)
-                            print(f"[+] Removed {path} (clean git repo)")
-                        except PermissionError as e:
-                            print(f"[ERROR] Could not remove {path}: Permission denied")
-                            if self.os_type == "windows":
-                                print(f"   Try running as Administrator or check if files are in use")
-                            else:
-                                print(f"   Try running with sudo or check file permissions")
-                        except Exception as e:
-                            print(f"[ERROR] Could not remove {path}: {e}")
-                    else:
-                        # Has uncommitted changes - preserve it
-                        print(f"[!] Preserved {path} (has uncommitted changes)")
-                        
-                except Exception as e:
-                    # If we can't check git status, preserve the directory for safety
-                    print(f"[!] Preserved {path} (could not check git status: {e})")
-            else:
-                # Not a git repository - preserve it for safety
-                # This matches the bash behavior: only remove git repos
-                print(f"[!] Preserved {path} (not a git repo)")
+        # Resolve git once before any worker needs it; without git nothing can be
+        # confirmed clean, so every installation is kept
+        if not self._find_git_executable():
+            _log(*output, "[WARNING] git not found; preserving all installations")
+            return True
         
+        # Inspect all repos in one shell where possible; the rest are checked per path
+        inspections = self._probe_repos(self.installations)
+        
+        # git checks and rmtree are I/O bound and independent per directory
+        max_workers = min(8, len(self.installations))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for lines in executor.map(lambda path: self._process_installation(path, inspections.get(path)),
+                                      self.installations):
+                output.extend(lines)
+        
+        # Workers only collect their lines; the whole phase is written at once
+        _log(*output)
         return True
     
     def uninstall(self) -> bool:
         """Main uninstallation process"""
-        print(f"Claude Code Docs Cross-Platform Uninstaller v{UNINSTALLER_VERSION}")
-        print("=" * 60)
-        print("")
+        _log(f"Claude Code Docs Cross-Platform Uninstaller v{UNINSTALLER_VERSION}",
+             "=" * 60,
+             "")
         
         # Step 1: Find all installations
         self.installations = self.find_installations()
         
+        summary = []
         if self.installations:
-            print("Found installations at:")
-            for path in self.installations:
-                print(f"  [DIR] {path}")
-            print("")
+            summary.append("Found installations at:")
+            summary.extend(f"  [DIR] {path}" for path in self.installations)
+            summary.append("")
         
         # Step 2: Show what will be removed
-        print("This will remove:")
-        print("  - The /docs command from ~/.claude/commands/docs.md")
-        print("  - All claude-code-docs hooks from ~/.claude/settings.json")
+        summary.append("This will remove:")
+        summary.append("  - The /docs command from ~/.claude/commands/docs.md")
+        summary.append("  - All claude-code-docs hooks from ~/.claude/settings.json")
         if self.installations:
-            print("  - Installation directories (if safe to remove)")
-        print("")
+            summary.append("  - Installation directories (if safe to remove)")
+        summary.append("")
+        _log(*summary)
         
         # Step 3: Get confirmation
         try:
@@ -531,19 +779,23 @@ class CrossPlatformUninstaller:
         # Step 5: Remove hooks
         if not self.remove_hooks():
             return False
+        
+        if not self.remove_state_file():
+            return False
             
         # Step 6: Remove directories
         if not self.remove_directories():
             return False
         
-        print("")
-        print("[SUCCESS] Uninstall complete!")
-        print("")
-        print("To reinstall:")
         if self.os_type == "windows":
-            print("curl -o install.py https://raw.githubusercontent.com/mccloudmedia/claude-code-docs/main/install.py; python install.py")
+            reinstall = "curl -o install.py https://raw.githubusercontent.com/mccloudmedia/claude-code-docs/main/install.py; python install.py"
         else:
-            print("curl -o install.py https://raw.githubusercontent.com/mccloudmedia/claude-code-docs/main/install.py && python3 install.py")
+            reinstall = "curl -o install.py https://raw.githubusercontent.com/mccloudmedia/claude-code-docs/main/install.py && python3 install.py"
+        _log("",
+             "[SUCCESS] Uninstall complete!",
+             "",
+             "To reinstall:",
+             reinstall)
         
         return True
 